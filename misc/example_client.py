@@ -2,30 +2,36 @@
 """
 Example client demonstrating how to use the async due diligence API.
 
+Uses a single httpx.AsyncClient with HTTP/2 for the whole submit + poll
+lifecycle: connections are pooled and kept alive, and HTTP/2 stream
+multiplexing lets polls for several jobs overlap on one TCP connection
+instead of head-of-line blocking behind each other.
+
 Usage:
     python example_client.py
 """
 
-import requests
+import asyncio
+import httpx
 import time
 import json
 
 API_BASE_URL = "http://localhost:8000"
 
 
-def submit_analysis(startup_name: str, startup_description: str):
+async def submit_analysis(client: httpx.AsyncClient, startup_name: str, startup_description: str):
     """Submit a due diligence analysis job"""
     print(f"📤 Submitting analysis for: {startup_name}")
-    
-    response = requests.post(
-        f"{API_BASE_URL}/analyze",
+
+    response = await client.post(
+        "/analyze",
         json={
             "startup_name": startup_name,
             "startup_description": startup_description,
             "funding_stage": "series-a"
         }
     )
-    
+
     if response.status_code == 202:
         data = response.json()
         print(f"✅ Job submitted! Job ID: {data['job_id']}")
@@ -35,10 +41,10 @@ def submit_analysis(startup_name: str, startup_description: str):
         return None
 
 
-def check_status(job_id: str):
+async def check_status(client: httpx.AsyncClient, job_id: str):
     """Check the status of a job"""
-    response = requests.get(f"{API_BASE_URL}/analyze/status/{job_id}")
-    
+    response = await client.get(f"/analyze/status/{job_id}")
+
     if response.status_code == 200:
         return response.json()
     else:
@@ -46,50 +52,68 @@ def check_status(job_id: str):
         return None
 
 
-def wait_for_completion(job_id: str, max_wait_seconds: int = 600, poll_interval: int = 5):
+async def wait_for_completion(client: httpx.AsyncClient, job_id: str,
+                              max_wait_seconds: int = 600, max_polls: int = 200):
     """
-    Poll job status until completion.
-    
+    Poll job status until completion, with exponential backoff.
+
+    Polls start at 1s and back off up to 15s, resetting whenever the job
+    status changes (e.g. queued -> started) so we stay responsive around
+    transitions without hammering the API during long quiet stretches.
+
     Args:
+        client: Shared HTTP client (connections are reused across polls)
         job_id: The job ID to monitor
         max_wait_seconds: Maximum time to wait (default 10 minutes)
-        poll_interval: How often to check status (default 5 seconds)
+        max_polls: Hard cap on status requests before giving up
     """
     print(f"⏳ Waiting for job {job_id} to complete...")
-    print(f"   (Polling every {poll_interval}s, max wait {max_wait_seconds}s)")
-    
+    print(f"   (Backoff polling 1s → 15s, max wait {max_wait_seconds}s)")
+
     start_time = time.time()
-    
-    while True:
+    delay = 1.0
+    last_status = None
+
+    for _ in range(max_polls):
         elapsed = time.time() - start_time
-        
+
         if elapsed > max_wait_seconds:
             print(f"⏰ Timeout! Job did not complete in {max_wait_seconds}s")
             return None
-        
-        status_data = check_status(job_id)
-        
+
+        status_data = await check_status(client, job_id)
+
         if not status_data:
-            time.sleep(poll_interval)
+            await asyncio.sleep(delay)
+            delay = min(delay * 1.7, 15.0)
             continue
-        
+
         status = status_data['status']
-        
+
         if status == 'finished':
             print(f"✅ Job completed in {elapsed:.1f}s!")
             return status_data['result']
-        
+
         elif status == 'failed':
             print(f"❌ Job failed: {status_data.get('error', 'Unknown error')}")
             return None
-        
+
         elif status == 'started':
             print(f"🔄 Job running... ({elapsed:.1f}s elapsed)")
-        
+
         elif status == 'queued':
             print(f"⏸️  Job queued... ({elapsed:.1f}s elapsed)")
-        
-        time.sleep(poll_interval)
+
+        # Reset backoff on a state change so we catch the next one quickly
+        if status != last_status:
+            delay = 1.0
+            last_status = status
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.7, 15.0)
+
+    print(f"⏰ Gave up after {max_polls} status checks")
+    return None
 
 
 def print_results(result):
@@ -97,36 +121,51 @@ def print_results(result):
     if not result:
         print("No results to display")
         return
-    
+
     print("\n" + "="*80)
     print("📊 DUE DILIGENCE RESULTS")
     print("="*80)
-    
+
     # Investment Decision
     if 'investment_decision' in result:
         decision = result['investment_decision']
         print(f"\n🎯 INVESTMENT DECISION:")
         print(json.dumps(decision, indent=2))
-    
+
     # Full Report (truncated)
     if 'full_report' in result and result['full_report']:
         report = result['full_report']
         print(f"\n📄 FULL REPORT (first 500 chars):")
         print(report[:500] + "..." if len(report) > 500 else report)
-    
+
     # Error Summary
     if 'errors' in result and result['errors']:
         print(f"\n⚠️  ERRORS ({len(result['errors'])}):")
         for error in result['errors'][:5]:  # Show first 5
             print(f"  - {error}")
-    
+
     print("\n" + "="*80)
 
 
-def main():
+async def track(client: httpx.AsyncClient, startup: dict):
+    """Submit one startup and follow it to completion."""
+    job_id = await submit_analysis(client, startup["name"], startup["description"])
+
+    if not job_id:
+        return
+
+    result = await wait_for_completion(client, job_id, max_wait_seconds=600)
+
+    if result:
+        print_results(result)
+    else:
+        print(f"\n❌ Analysis failed or timed out for {startup['name']}")
+
+
+async def main():
     """Run example analysis"""
     print("🚀 Due Diligence API Client Example\n")
-    
+
     # Example startups to analyze
     examples = [
         {
@@ -146,27 +185,13 @@ def main():
             """
         }
     ]
-    
-    # Use the first example
-    startup = examples[0]
-    
-    # Step 1: Submit job
-    job_id = submit_analysis(startup["name"], startup["description"])
-    
-    if not job_id:
-        return
-    
-    # Step 2: Wait for completion
-    result = wait_for_completion(job_id, max_wait_seconds=600, poll_interval=5)
-    
-    # Step 3: Display results
-    if result:
-        print_results(result)
-    else:
-        print("\n❌ Analysis failed or timed out")
-    
+
+    # One HTTP/2 client for every job: polls multiplex over one connection
+    async with httpx.AsyncClient(http2=True, base_url=API_BASE_URL) as client:
+        await asyncio.gather(*(track(client, startup) for startup in examples))
+
     print("\n✨ Done!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
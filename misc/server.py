@@ -7,21 +7,31 @@ What changed from Step 2:
     - Rate limiting: max 5 concurrent jobs per API key
     - Jobs are now scoped to the API key that created them
     - Added /docs protection (requires API key)
+    - Job store moved from in-memory dicts to Redis hashes
 
 Security model:
     - API keys are stored in environment variable (comma-separated)
     - Each key gets its own job namespace (can't see other users' jobs)
     - Simple rate limit: max concurrent jobs per key
 
+Storage model:
+    - job:{api_key}:{job_id}  -> Redis hash with the job fields
+    - jobs:{api_key}          -> Redis set of that key's job_ids
+    - Both expire after 24h, so completed jobs clean themselves up
+    - All multi-command writes go through one pipeline (one round trip)
+
+This means the API survives restarts and can run with uvicorn
+--workers N — all processes share the same job store.
+
 What's still missing:
     - Key rotation / revocation
     - Per-key rate limit configuration
-    - Persistent job storage (still in-memory)
     - Structured logging
 
 Run:
     export DUE_DILIGENCE_API_KEYS="test-key-1,test-key-2"
     uv run uvicorn server:app --reload
+    uv run rq worker agents   # in another shell: runs the pipelines
 
 Test:
     # Without API key — rejected
@@ -37,17 +47,24 @@ Test:
 """
 
 import asyncio
+import hmac
+import json
 import os
-import uuid
+import time
+import secrets
 import logging
 from datetime import datetime, timezone
 from typing import Optional
-from collections import defaultdict
 
 from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import APIKeyHeader
 from pydantic import BaseModel
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from rq import Queue
 
+from src.main_redis import ORJSONSerializer
 from src.workflow.graph import run_due_diligence
 
 # ---------------------------------------------------------------------------
@@ -55,14 +72,21 @@ from src.workflow.graph import run_due_diligence
 # ---------------------------------------------------------------------------
 # Load API keys from environment. In production, these come from a secrets
 # manager (AWS Secrets Manager, Doppler, etc.), not a .env file.
-VALID_API_KEYS = set(
-    key.strip()
+# Frozen as bytes so verification can use hmac.compare_digest, which
+# doesn't leak key contents through comparison timing.
+VALID_API_KEYS: tuple[bytes, ...] = tuple(
+    key.strip().encode()
     for key in os.getenv("DUE_DILIGENCE_API_KEYS", "").split(",")
     if key.strip()
 )
 
 MAX_CONCURRENT_JOBS_PER_KEY = 5  # Rate limit
 
+REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.getenv("REDIS_PORT", 6379))
+JOB_TTL_SECONDS = 86400  # Jobs expire from Redis after 24 hours
+JOB_TIMEOUT = int(os.getenv("JOB_TIMEOUT", 600))  # RQ kills jobs past this
+
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
@@ -82,11 +106,120 @@ app = FastAPI(
 )
 
 # ---------------------------------------------------------------------------
-# Job store — keyed by API key, then by job_id
+# Job store — Redis hashes, keyed by API key then job_id
 # ---------------------------------------------------------------------------
-# Structure: { api_key: { job_id: job_data } }
-# This isolates jobs per user. User A can't see User B's jobs.
-jobs_by_key: dict[str, dict[str, dict]] = defaultdict(dict)
+# decode_responses=True so hash fields come back as str, not bytes.
+# The client manages its own connection pool; every endpoint shares it.
+redis = Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
+
+# Sync clients: RQ needs a bytes-mode connection for enqueue, and the
+# worker processes (which have no event loop of their own around the job)
+# update job state through a decoded sync client.
+redis_conn = SyncRedis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=False)
+state_redis = SyncRedis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
+
+# Pipelines run out-of-process: `python -m src.worker` from the repo root.
+# Same queue, same serializer as src/main_redis — a worker deserializing
+# with orjson would crash on a pickled payload from this producer.
+agent_tasks = Queue("agents", connection=redis_conn, serializer=ORJSONSerializer)
+
+
+# A fresh datetime.now(timezone.utc).isoformat() costs a TZ lookup plus
+# string formatting on every call; submit/completion timestamps only need
+# second precision, so reformat at most once per second.
+_iso_cache: list = [0, ""]
+
+
+def _iso_now() -> str:
+    t = int(time.time())
+    if _iso_cache[0] != t:
+        _iso_cache[0] = t
+        _iso_cache[1] = datetime.fromtimestamp(t, timezone.utc).isoformat()
+    return _iso_cache[1]
+
+
+def _job_key(api_key: str, job_id: str) -> str:
+    return f"job:{api_key}:{job_id}"
+
+
+def _jobs_set_key(api_key: str) -> str:
+    return f"jobs:{api_key}"
+
+
+def _running_key(api_key: str) -> str:
+    return f"running:{api_key}"
+
+
+# Global gauge of in-flight jobs across all keys — read by /health
+GLOBAL_RUNNING_KEY = "running:total"
+
+
+def _serialize_job(job: dict) -> dict:
+    """Flatten a job dict into hash-safe string fields."""
+    flat = {}
+    for field, value in job.items():
+        if value is None:
+            flat[field] = ""
+        elif isinstance(value, dict):
+            flat[field] = json.dumps(value, default=str)
+        else:
+            flat[field] = value
+    return flat
+
+
+def _deserialize_job(flat: dict) -> dict:
+    """Rebuild a job dict from its Redis hash."""
+    job = dict(flat)
+    for field in ("stage", "completed_at", "error"):
+        if job.get(field) == "":
+            job[field] = None
+    job["result"] = json.loads(job["result"]) if job.get("result") else None
+    return job
+
+
+async def _sweeper():
+    """
+    Periodically prune stale job ids from the per-key sets.
+
+    Job hashes expire via their Redis TTL, but the jobs:{api_key} set
+    members for those jobs linger until the whole set expires. Without
+    pruning, list_jobs pipelines grow with every job a key has ever
+    submitted. Every 5 minutes, drop set members whose hash is gone.
+
+    Each pass also reconciles the running counters. They are maintained
+    with INCR at submit and DECR in the worker's finally block, but a
+    SIGKILL'd worker (OOM, redeploy) never runs finally, so a slot leaks
+    and the key stays throttled. The job hashes are the ground truth:
+    recount jobs whose status is "running" and overwrite the counters.
+    """
+    while True:
+        await asyncio.sleep(300)
+        try:
+            global_running = 0
+            async for set_key in redis.scan_iter(match="jobs:*", count=100):
+                api_key = set_key.split(":", 1)[1]
+                job_ids = await redis.smembers(set_key)
+                if not job_ids:
+                    continue
+                pipe = redis.pipeline(transaction=False)
+                for job_id in job_ids:
+                    pipe.hget(_job_key(api_key, job_id), "status")
+                statuses = await pipe.execute()
+                stale = [jid for jid, st in zip(job_ids, statuses) if st is None]
+                if stale:
+                    await redis.srem(set_key, *stale)
+                    logger.info(f"Swept {len(stale)} expired job ids for {api_key[:8]}...")
+                running = sum(1 for st in statuses if st == "running")
+                global_running += running
+                await redis.set(_running_key(api_key), running, ex=JOB_TTL_SECONDS)
+            await redis.set(GLOBAL_RUNNING_KEY, global_running, ex=JOB_TTL_SECONDS)
+        except Exception:
+            logger.exception("Job sweeper pass failed")
+
+
+@app.on_event("startup")
+async def start_sweeper():
+    asyncio.create_task(_sweeper())
 
 
 # ---------------------------------------------------------------------------
@@ -95,18 +228,24 @@ jobs_by_key: dict[str, dict[str, dict]] = defaultdict(dict)
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
-async def verify_api_key(api_key: str = Depends(api_key_header)) -> str:
+async def verify_api_key(request: Request, api_key: str = Depends(api_key_header)) -> str:
     """
     Dependency that validates the API key.
 
     FastAPI dependencies are powerful — this runs before every endpoint
     that includes it. If it raises an exception, the request is rejected
     before your endpoint code runs.
+
+    Keys are checked with hmac.compare_digest — constant time per key,
+    so an attacker can't binary-search a valid key byte by byte. The
+    validated key is stashed on request.state so anything downstream in
+    the same request can read it without re-validating.
     """
     if not VALID_API_KEYS:
         # No keys configured = dev mode, allow everything
         # REMOVE THIS IN PRODUCTION
         logger.warning("No API keys configured — running in dev mode")
+        request.state.api_key = "dev-mode"
         return "dev-mode"
 
     if not api_key:
@@ -115,24 +254,29 @@ async def verify_api_key(api_key: str = Depends(api_key_header)) -> str:
             detail="Missing API key. Include X-API-Key header.",
         )
 
-    if api_key not in VALID_API_KEYS:
+    api_key_b = api_key.encode()
+    if not any(hmac.compare_digest(valid, api_key_b) for valid in VALID_API_KEYS):
         raise HTTPException(
             status_code=401,
             detail="Invalid API key.",
         )
 
+    request.state.api_key = api_key
     return api_key
 
 
-def check_rate_limit(api_key: str):
+async def check_rate_limit(api_key: str):
     """
     Check if the user has hit their concurrent job limit.
 
     This is a simple rate limit — you can only have N jobs running at once.
     More sophisticated: per-hour limits, token budgets, etc.
+
+    The per-key running count is a maintained counter (INCR at submit,
+    DECR when the pipeline ends), so this check is a single O(1) GET no
+    matter how many jobs the key has accumulated.
     """
-    user_jobs = jobs_by_key.get(api_key, {})
-    running = sum(1 for j in user_jobs.values() if j["status"] == "running")
+    running = int(await redis.get(_running_key(api_key)) or 0)
 
     if running >= MAX_CONCURRENT_JOBS_PER_KEY:
         raise HTTPException(
@@ -169,7 +313,7 @@ class JobStatusResponse(BaseModel):
 # ---------------------------------------------------------------------------
 # Pipeline runner
 # ---------------------------------------------------------------------------
-async def run_pipeline(
+def run_pipeline(
     api_key: str,
     job_id: str,
     startup_name: str,
@@ -177,37 +321,58 @@ async def run_pipeline(
     funding_stage: Optional[str],
 ):
     """
-    Runs the due diligence pipeline and updates job state.
+    Runs the due diligence pipeline and updates job state in Redis.
 
-    Note the api_key parameter — we need it to find the right job in
-    our per-user job store.
+    Executed by an RQ worker (`rq worker agents`), not the API process —
+    a slow pipeline can't block request handling and an API restart
+    doesn't kill running jobs. The api_key parameter addresses the right
+    job hash in our per-user namespace.
     """
-    jobs = jobs_by_key[api_key]
+    key = _job_key(api_key, job_id)
 
     try:
         logger.info(f"[{job_id[:8]}] Starting pipeline for {startup_name}")
-        jobs[job_id]["stage"] = "running"
+        state_redis.hset(key, "stage", "running")
 
-        final_state = await run_due_diligence(
+        final_state = asyncio.run(run_due_diligence(
             startup_name=startup_name,
-            startup_descrption=description,
+            startup_description=description,
             funding_stage=funding_stage,
-        )
+        ))
 
-        jobs[job_id]["status"] = "complete"
-        jobs[job_id]["completed_at"] = datetime.now(timezone.utc).isoformat()
-        jobs[job_id]["result"] = {
+        result = {
             "investment_decision": final_state.get("investment_decision"),
             "full_report": final_state.get("full_report"),
             "errors": final_state.get("errors", []),
         }
+        # Batch the terminal-state writes into one round trip
+        pipe = state_redis.pipeline(transaction=False)
+        pipe.hset(key, mapping={
+            "status": "complete",
+            "completed_at": _iso_now(),
+            "result": json.dumps(result, default=str),
+        })
+        pipe.expire(key, JOB_TTL_SECONDS)
+        pipe.execute()
         logger.info(f"[{job_id[:8]}] Pipeline complete")
 
     except Exception as e:
         logger.exception(f"[{job_id[:8]}] Pipeline failed")
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["error"] = str(e)
-        jobs[job_id]["completed_at"] = datetime.now(timezone.utc).isoformat()
+        pipe = state_redis.pipeline(transaction=False)
+        pipe.hset(key, mapping={
+            "status": "failed",
+            "error": str(e),
+            "completed_at": _iso_now(),
+        })
+        pipe.expire(key, JOB_TTL_SECONDS)
+        pipe.execute()
+
+    finally:
+        # Release the rate-limit slot and drop the gauge — success or failure
+        pipe = state_redis.pipeline(transaction=False)
+        pipe.decr(_running_key(api_key))
+        pipe.decr(GLOBAL_RUNNING_KEY)
+        pipe.execute()
 
 
 # ---------------------------------------------------------------------------
@@ -224,25 +389,68 @@ async def submit_analysis(
 
     Requires X-API-Key header. Rate limited to 5 concurrent jobs per key.
     """
-    check_rate_limit(api_key)
+    await check_rate_limit(api_key)
 
-    job_id = str(uuid.uuid4())
-    jobs = jobs_by_key[api_key]
+    # Opaque hex id — cheaper than uuid4's field validation + formatting,
+    # same 128 bits of entropy, and nothing parses RFC-4122 structure.
+    job_id = secrets.token_hex(16)
 
-    jobs[job_id] = {
+    job = {
         "job_id": job_id,
         "status": "running",
         "stage": "queued",
         "startup_name": request.startup_name,
-        "submitted_at": datetime.now(timezone.utc).isoformat(),
+        "submitted_at": _iso_now(),
         "completed_at": None,
         "result": None,
         "error": None,
     }
 
-    asyncio.create_task(
-        run_pipeline(api_key, job_id, request.startup_name, request.description, request.funding_stage)
-    )
+    # hash write + set membership + TTLs, all in a single round trip
+    pipe = redis.pipeline(transaction=False)
+    pipe.hset(_job_key(api_key, job_id), mapping=_serialize_job(job))
+    pipe.sadd(_jobs_set_key(api_key), job_id)
+    pipe.expire(_job_key(api_key, job_id), JOB_TTL_SECONDS)
+    pipe.expire(_jobs_set_key(api_key), JOB_TTL_SECONDS)
+    pipe.incr(_running_key(api_key))  # claim a rate-limit slot
+    pipe.incr(GLOBAL_RUNNING_KEY)     # bump the /health gauge
+    # TTL on the counters so slots leaked by a killed worker (no finally
+    # block runs on SIGKILL/OOM) age out instead of rate-limiting the key
+    # forever; the sweeper reconciles drift well before then
+    pipe.expire(_running_key(api_key), JOB_TTL_SECONDS)
+    pipe.expire(GLOBAL_RUNNING_KEY, JOB_TTL_SECONDS)
+    await pipe.execute()
+
+    # Hand the pipeline to an RQ worker; the API only does bookkeeping.
+    # If the enqueue itself fails, no worker will ever run the finally
+    # block that releases the slot — give it back here.
+    try:
+        agent_tasks.enqueue(
+            run_pipeline,
+            api_key,
+            job_id,
+            request.startup_name,
+            request.description,
+            request.funding_stage,
+            job_timeout=JOB_TIMEOUT,
+            result_ttl=JOB_TTL_SECONDS,
+            failure_ttl=JOB_TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.exception(f"[{job_id[:8]}] Enqueue failed")
+        pipe = redis.pipeline(transaction=False)
+        pipe.hset(_job_key(api_key, job_id), mapping={
+            "status": "failed",
+            "error": f"enqueue failed: {e}",
+            "completed_at": _iso_now(),
+        })
+        pipe.decr(_running_key(api_key))
+        pipe.decr(GLOBAL_RUNNING_KEY)
+        await pipe.execute()
+        raise HTTPException(
+            status_code=503,
+            detail="Job queue unavailable, try again shortly",
+        )
 
     logger.info(f"[{job_id[:8]}] Job submitted by {api_key[:8]}... for {request.startup_name}")
     return JobSubmitResponse(job_id=job_id, status="running")
@@ -258,13 +466,55 @@ async def get_job(
 
     You can only see jobs you created (scoped by API key).
     """
-    jobs = jobs_by_key.get(api_key, {})
-    job = jobs.get(job_id)
+    flat = await redis.hgetall(_job_key(api_key, job_id))
+
+    if not flat:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return JobStatusResponse(**_deserialize_job(flat))
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job(
+    job_id: str,
+    api_key: str = Depends(verify_api_key),
+):
+    """
+    Server-push completion via Server-Sent Events.
 
-    if not job:
+    Instead of polling GET /jobs/{id} every few seconds, clients open this
+    stream once and get a "complete" event when the pipeline finishes.
+    Heartbeat events are sent every 30s to keep intermediaries from
+    closing the idle connection. The polling endpoint stays as a fallback.
+
+    The pipeline runs in an RQ worker process, so completion is observed
+    by watching the job hash server-side; clients still make one request
+    per job instead of one per poll interval.
+    """
+    key = _job_key(api_key, job_id)
+    if not await redis.exists(key):
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return JobStatusResponse(**job)
+    async def event_stream():
+        last_heartbeat = time.monotonic()
+        while await redis.hget(key, "status") == "running":
+            await asyncio.sleep(2)
+            if time.monotonic() - last_heartbeat >= 30:
+                # Keep the connection alive while the pipeline runs
+                stage = await redis.hget(key, "stage")
+                yield f"event: heartbeat\ndata: {json.dumps({'stage': stage})}\n\n"
+                last_heartbeat = time.monotonic()
+
+        job = _deserialize_job(await redis.hgetall(key))
+        payload = {
+            "job_id": job_id,
+            "status": job["status"],
+            "result": job["result"],
+            "error": job["error"],
+        }
+        yield f"event: complete\ndata: {json.dumps(payload, default=str)}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 @app.get("/jobs")
@@ -274,7 +524,18 @@ async def list_jobs(api_key: str = Depends(verify_api_key)):
 
     Only shows jobs created with your API key.
     """
-    jobs = jobs_by_key.get(api_key, {})
+    job_ids = await redis.smembers(_jobs_set_key(api_key))
+
+    jobs = []
+    if job_ids:
+        # Pipelined HGETALLs: one round trip for the whole listing
+        pipe = redis.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hgetall(_job_key(api_key, job_id))
+        for flat in await pipe.execute():
+            if flat:  # hash may have expired after the set was read
+                jobs.append(flat)
+
     return {
         "jobs": [
             {
@@ -283,7 +544,7 @@ async def list_jobs(api_key: str = Depends(verify_api_key)):
                 "startup_name": j["startup_name"],
                 "submitted_at": j["submitted_at"],
             }
-            for j in jobs.values()
+            for j in jobs
         ],
         "total": len(jobs),
     }
@@ -294,15 +555,12 @@ async def health():
     """
     Health check — no auth required.
 
-    Load balancers need to hit this without credentials.
-    Be careful not to leak sensitive info here.
+    Load balancers need to hit this without credentials — and they probe
+    every few seconds, so this must not scan the job store. active_jobs
+    is a maintained gauge: one O(1) GET.
     """
-    total_running = sum(
-        1
-        for user_jobs in jobs_by_key.values()
-        for j in user_jobs.values()
-        if j["status"] == "running"
-    )
+    total_running = int(await redis.get(GLOBAL_RUNNING_KEY) or 0)
+
     return {
         "status": "ok",
         "active_jobs": total_running,
@@ -334,7 +592,6 @@ async def health():
 #   - Rate limit: max concurrent jobs
 #
 # Next steps for production:
-#   - Move job store to Redis (persistence, expiry)
 #   - Add structured JSON logging
 #   - Add request ID for tracing
 #   - Add Dockerfile for deployment
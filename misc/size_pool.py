@@ -0,0 +1,97 @@
+"""Recommend an RQ worker count from observed job timings (M/M/c model).
+
+Reads enqueued/started/ended timestamps for recent finished jobs straight
+from Redis (one pipeline of HMGETs, no full job loads), estimates the
+arrival rate λ and service rate µ, then finds the smallest worker count c
+whose Erlang-C queueing probability stays under the target. Emit the
+number; an autoscaler or a human sets the pool to it.
+
+Usage:
+    python misc/size_pool.py [--p-max 0.2] [--max-workers 64]
+"""
+
+import argparse
+import math
+import os
+from datetime import datetime
+
+from redis import Redis
+from rq.job import Job
+from rq.registry import FinishedJobRegistry
+
+REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
+REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
+REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', None)
+
+
+def erlang_c(c: int, offered_load: float) -> float:
+    """Probability an arriving job must queue, for c servers (Erlang C)."""
+    if offered_load >= c:
+        return 1.0  # unstable: queue grows without bound
+    # Closed form: (a^c/c!) * c/(c-a) over the normalizing sum
+    numerator = (offered_load ** c / math.factorial(c)) * (c / (c - offered_load))
+    denominator = sum(offered_load ** k / math.factorial(k) for k in range(c)) + numerator
+    return numerator / denominator
+
+
+def _parse_ts(raw: bytes) -> datetime:
+    return datetime.fromisoformat(raw.decode().rstrip('Z'))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--p-max', type=float, default=0.2,
+                        help='max acceptable probability a job queues (default 0.2)')
+    parser.add_argument('--max-workers', type=int, default=64,
+                        help='upper bound on the recommended pool size')
+    parser.add_argument('--sample', type=int, default=500,
+                        help='how many recent finished jobs to sample')
+    args = parser.parse_args()
+
+    redis_conn = Redis(host=REDIS_HOST, port=REDIS_PORT, password=REDIS_PASSWORD)
+    registry = FinishedJobRegistry('agents', connection=redis_conn)
+    job_ids = registry.get_job_ids(0, args.sample - 1)
+    if not job_ids:
+        raise SystemExit("No finished jobs to measure — run some load first")
+
+    # One pipeline: three timestamp fields per job, no payload fetches
+    pipe = redis_conn.pipeline(transaction=False)
+    for job_id in job_ids:
+        pipe.hmget(Job.key_for(job_id), 'enqueued_at', 'started_at', 'ended_at')
+    rows = pipe.execute()
+
+    enqueued_times = []
+    service_seconds = []
+    for enqueued, started, ended in rows:
+        if not (enqueued and started and ended):
+            continue
+        enqueued_times.append(_parse_ts(enqueued))
+        service_seconds.append((_parse_ts(ended) - _parse_ts(started)).total_seconds())
+
+    if len(enqueued_times) < 2:
+        raise SystemExit("Not enough complete jobs to estimate rates")
+
+    window = (max(enqueued_times) - min(enqueued_times)).total_seconds()
+    if window <= 0:
+        raise SystemExit("All jobs enqueued at the same instant — widen the sample")
+
+    arrival_rate = (len(enqueued_times) - 1) / window          # λ, jobs/s
+    service_rate = 1.0 / (sum(service_seconds) / len(service_seconds))  # µ, jobs/s
+    offered_load = arrival_rate / service_rate                  # a = λ/µ
+
+    for c in range(1, args.max_workers + 1):
+        if erlang_c(c, offered_load) <= args.p_max:
+            break
+    else:
+        c = args.max_workers
+
+    print(f"jobs sampled:    {len(service_seconds)}")
+    print(f"arrival rate λ:  {arrival_rate:.4f} jobs/s")
+    print(f"service rate µ:  {service_rate:.4f} jobs/s (mean {1 / service_rate:.1f}s per job)")
+    print(f"offered load a:  {offered_load:.2f}")
+    print(f"P(queue) target: {args.p_max}")
+    print(f"recommended workers: {c}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,5 +5,7 @@
 export OBJC_DISABLE_INITIALIZE_FORK_SAFETY=YES
 
 echo "Starting RQ worker with fork safety disabled..."
-cd "$(dirname "$0")"
-uv run rq worker agents
+cd "$(dirname "$0")/.."
+# src.worker pre-warms the LangGraph workflow after fork so the
+# first job skips import + compile cost
+uv run python -m src.worker
@@ -1,13 +1,72 @@
 """Analysis agents for interpreting research data."""
 
+import asyncio
+from typing import Any, Dict, Optional
+
 from .financial_analyst import run_financial_analyst
 from .risk_assessor import run_risk_assessor
 from .tech_evaluator import run_tech_evaluator
 from .legal_reviewer import run_legal_reviewer
+from ...config.agent_configs import FINANCIAL_ANALYST, TECH_EVALUATOR, LEGAL_REVIEWER
+
+# Grace on top of each agent's own timeout — covers SDK setup/teardown
+# so a hung subprocess can't stall the whole batch indefinitely.
+_TIMEOUT_GRACE_SECONDS = 30
+
+
+def start_all_analysis(
+    startup_name: str,
+    startup_description: str,
+    company_profile: Optional[Dict[str, Any]] = None,
+    market_analysis: Optional[Dict[str, Any]] = None,
+    team_analysis: Optional[Dict[str, Any]] = None,
+) -> Dict[str, "asyncio.Task"]:
+    """
+    Launch the three data-independent analysis agents as tasks.
+
+    financial_analyst, tech_evaluator, and legal_reviewer each only need
+    their own slice of the research outputs, so overlapping their LLM
+    round-trips makes the batch cost max() instead of sum(). Each agent
+    is wrapped in its own asyncio.wait_for so one slow model can't stall
+    the others past its configured timeout.
+
+    Returns a name -> Task mapping instead of gathered results, so a
+    dependent agent (the risk assessor) can await exactly the tasks it
+    consumes rather than a phase barrier over the whole batch. Tasks
+    raise on failure; callers handle per-task exceptions.
+    """
+    return {
+        "financial_analyst": asyncio.create_task(asyncio.wait_for(
+            run_financial_analyst(
+                company_profile=company_profile,
+                market_analysis=market_analysis,
+                startup_name=startup_name,
+                startup_description=startup_description,
+            ),
+            timeout=FINANCIAL_ANALYST.timeout_seconds + _TIMEOUT_GRACE_SECONDS,
+        )),
+        "tech_evaluator": asyncio.create_task(asyncio.wait_for(
+            run_tech_evaluator(
+                startup_name=startup_name,
+                startup_description=startup_description,
+                team_analysis=team_analysis,
+            ),
+            timeout=TECH_EVALUATOR.timeout_seconds + _TIMEOUT_GRACE_SECONDS,
+        )),
+        "legal_reviewer": asyncio.create_task(asyncio.wait_for(
+            run_legal_reviewer(
+                startup_name=startup_name,
+                market_analysis=market_analysis,
+            ),
+            timeout=LEGAL_REVIEWER.timeout_seconds + _TIMEOUT_GRACE_SECONDS,
+        )),
+    }
+
 
 __all__ = [
     "run_financial_analyst",
     "run_risk_assessor",
     "run_tech_evaluator",
     "run_legal_reviewer",
-]
\ No newline at end of file
+    "start_all_analysis",
+]
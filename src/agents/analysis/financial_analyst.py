@@ -1,30 +1,11 @@
+import orjson
 from typing import Optional, Dict, Any
 from ...config.agent_configs import FINANCIAL_ANALYST
 from ..base import run_agent, AgentResult, parse_json_from_output
-import asyncio
+from ..cache import agent_result_cache, dependency_key, source_version
 
-async def run_financial_analyst(
-    company_profile: Optional[Dict[str, Any]] = None,
-    market_analysis: Optional[Dict[str, Any]] = None,
-    startup_name: str = "",
-    startup_description: str = ""
-) -> AgentResult:
-    """Analyze financial health based on research data."""
-    # Build context from available data
-    context_parts = []
-
-    if startup_name:
-        context_parts.append(f"Startup Name: {startup_name}")
-    if startup_description:
-        context_parts.append(f"Description: {startup_description}")
-    if company_profile:
-        context_parts.append(f"\n## Company Profile Data:\n{_format_dict(company_profile)}")
-    if market_analysis:
-        context_parts.append(f"\n## Market Analysis Data:\n{_format_dict(market_analysis)}")
 
-    context = "\n".join(context_parts)
-
-    prompt = f"""Analyze the financial health and sustainability of this startup:
+PROMPT_TEMPLATE = """Analyze the financial health and sustainability of this startup:
 
 {context}
 
@@ -47,34 +28,65 @@ Format your response as valid JSON:
 Base analysis on available data. Note if data is missing.
 """
 
-    result = await run_agent(
-        agent_name=FINANCIAL_ANALYST.name,
-        prompt=prompt,
-        tools=FINANCIAL_ANALYST.tools,
-        model=FINANCIAL_ANALYST.model,
-        system_prompt=FINANCIAL_ANALYST.system_prompt,
-        timeout_seconds=FINANCIAL_ANALYST.timeout_seconds
-    )
 
-    if result.success and result.raw_output:
-        parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
-        if parsed:
-            result.output = parsed
-        else:
-            result.success = False
-            result.error = "JSON parse failed: could not extract structured output"
-
-    return result
-
-
-def _format_dict(d: Dict[str, Any], indent: int = 0) -> str:
-    """Format a dictionary for readable output."""
-    lines = []
-    prefix = "  " * indent
-    for key, value in d.items():
-        if isinstance(value, dict):
-            lines.append(f"{prefix}{key}:")
-            lines.append(_format_dict(value, indent + 1))
-        else:
-            lines.append(f"{prefix}{key}: {value}")
-    return "\n".join(lines)
\ No newline at end of file
+async def run_financial_analyst(
+    company_profile: Optional[Dict[str, Any]] = None,
+    market_analysis: Optional[Dict[str, Any]] = None,
+    startup_name: str = "",
+    startup_description: str = ""
+) -> AgentResult:
+    """Analyze financial health based on research data."""
+    # No input data means no useful analysis — skip the LLM round-trip
+    if not (company_profile or market_analysis or startup_description):
+        return AgentResult(
+            success=False,
+            error="Insufficient input: no company profile, market analysis, or description",
+            agent_name=FINANCIAL_ANALYST.name,
+            execution_time_ms=0,
+        )
+
+    # Build context from available data
+    context_parts = []
+
+    if startup_name:
+        context_parts.append(f"Startup Name: {startup_name}")
+    if startup_description:
+        context_parts.append(f"Description: {startup_description}")
+    if company_profile:
+        context_parts.append(f"\n## Company Profile Data:\n{orjson.dumps(company_profile, default=str).decode()}")
+    if market_analysis:
+        context_parts.append(f"\n## Market Analysis Data:\n{orjson.dumps(market_analysis, default=str).decode()}")
+
+    context = "\n".join(context_parts)
+
+    prompt = PROMPT_TEMPLATE.format_map({"context": context})
+
+    async def execute() -> AgentResult:
+        result = await run_agent(
+            agent_name=FINANCIAL_ANALYST.name,
+            prompt=prompt,
+            tools=FINANCIAL_ANALYST.tools,
+            model=FINANCIAL_ANALYST.model,
+            system_prompt=FINANCIAL_ANALYST.system_prompt,
+            timeout_seconds=FINANCIAL_ANALYST.timeout_seconds
+        )
+
+        if result.success and result.raw_output:
+            parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
+            if parsed:
+                result.output = parsed
+            else:
+                result.success = False
+                result.error = "JSON parse failed: could not extract structured output"
+
+        return result
+
+    # Keyed on the upstream payloads, not just startup identity, so
+    # refreshed research invalidates this analysis
+    key = dependency_key(
+        FINANCIAL_ANALYST.name, source_version(__file__),
+        startup_name, startup_description, company_profile, market_analysis,
+    )
+    return await agent_result_cache.get_or_compute(
+        key, ttl=3600, factory=execute, cache_if=lambda r: r.success
+    )
\ No newline at end of file
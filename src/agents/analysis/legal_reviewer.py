@@ -1,20 +1,10 @@
 from ...config.agent_configs import LEGAL_REVIEWER
 from typing import Optional, Dict, Any
 from ..base import run_agent, AgentResult, parse_json_from_output
-import asyncio
+from ..cache import agent_result_cache, dependency_key, source_version
 
-async def run_legal_reviewer(
-    startup_name: str,
-    market_analysis: Optional[Dict[str, Any]] = None
-) -> AgentResult:
-    """Conduct legal due diligence review."""
-    market_context = ""
-    if market_analysis:
-        market_def = market_analysis.get("market_definition", "")
-        if market_def:
-            market_context = f"\nMarket: {market_def}"
 
-    prompt = f"""Conduct a legal due diligence review for this startup:
+PROMPT_TEMPLATE = """Conduct a legal due diligence review for this startup:
 
 Startup Name: {startup_name}{market_context}
 
@@ -37,21 +27,47 @@ Format your response as valid JSON:
 If no legal issues found, indicate that clearly.
 """
 
-    result = await run_agent(
-        agent_name=LEGAL_REVIEWER.name,
-        prompt=prompt,
-        tools=LEGAL_REVIEWER.tools,
-        model=LEGAL_REVIEWER.model,
-        system_prompt=LEGAL_REVIEWER.system_prompt,
-        timeout_seconds=LEGAL_REVIEWER.timeout_seconds
-    )
 
-    if result.success and result.raw_output:
-        parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
-        if parsed:
-            result.output = parsed
-        else:
-            result.success = False
-            result.error = "JSON parse failed: could not extract structured output"
+async def run_legal_reviewer(
+    startup_name: str,
+    market_analysis: Optional[Dict[str, Any]] = None
+) -> AgentResult:
+    """Conduct legal due diligence review."""
+    market_context = ""
+    if market_analysis:
+        market_def = market_analysis.get("market_definition", "")
+        if market_def:
+            market_context = f"\nMarket: {market_def}"
+
+    prompt = PROMPT_TEMPLATE.format_map({
+        "startup_name": startup_name,
+        "market_context": market_context,
+    })
+
+    async def execute() -> AgentResult:
+        result = await run_agent(
+            agent_name=LEGAL_REVIEWER.name,
+            prompt=prompt,
+            tools=LEGAL_REVIEWER.tools,
+            model=LEGAL_REVIEWER.model,
+            system_prompt=LEGAL_REVIEWER.system_prompt,
+            timeout_seconds=LEGAL_REVIEWER.timeout_seconds
+        )
 
-    return result
\ No newline at end of file
+        if result.success and result.raw_output:
+            parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
+            if parsed:
+                result.output = parsed
+            else:
+                result.success = False
+                result.error = "JSON parse failed: could not extract structured output"
+
+        return result
+
+    key = dependency_key(
+        LEGAL_REVIEWER.name, source_version(__file__),
+        startup_name, market_analysis,
+    )
+    return await agent_result_cache.get_or_compute(
+        key, ttl=3600, factory=execute, cache_if=lambda r: r.success
+    )
\ No newline at end of file
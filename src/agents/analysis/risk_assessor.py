@@ -1,46 +1,14 @@
-from ...config.agent_configs import RISK_ASSESSOR
-from typing import Optional, Dict, Any
-from ..base import run_agent, AgentResult, parse_json_from_output
-import asyncio
-
 """Risk Assessor Agent - identifies risks across all domains."""
 
-import json
+import orjson
 from typing import Optional, Dict, Any, List
 from ..base import run_agent, AgentResult, parse_json_from_output
+from ..cache import agent_result_cache, dependency_key, source_version
 from ...config.agent_configs import RISK_ASSESSOR
 
 
-async def run_risk_assessor(
-    research_outputs: List[Dict[str, Any]],
-    analysis_outputs: Optional[List[Dict[str, Any]]] = None,
-    startup_name: str = ""
-) -> AgentResult:
-    """Perform comprehensive risk assessment using all available data."""
-    # Compile all available data
-    context_parts = []
-
-    if startup_name:
-        context_parts.append(f"Startup: {startup_name}\n")
-
-    context_parts.append("## Research Findings:")
-    for output in research_outputs:
-        if output.get("success") and output.get("output"):
-            agent_name = output.get("agent", "Unknown")
-            context_parts.append(f"\n### {agent_name}:")
-            context_parts.append(json.dumps(output.get("output"), indent=2, default=str))
 
-    if analysis_outputs:
-        context_parts.append("\n## Analysis Findings:")
-        for output in analysis_outputs:
-            if output.get("success") and output.get("output"):
-                agent_name = output.get("agent", "Unknown")
-                context_parts.append(f"\n### {agent_name}:")
-                context_parts.append(json.dumps(output.get("output"), indent=2, default=str))
-
-    context = "\n".join(context_parts)
-
-    prompt = f"""Based on all research and analysis, perform a comprehensive risk assessment:
+PROMPT_TEMPLATE = """Based on all research and analysis, perform a comprehensive risk assessment:
 
 {context}
 
@@ -66,21 +34,67 @@ Format as JSON:
 }}
 """
 
-    result = await run_agent(
-        agent_name=RISK_ASSESSOR.name,
-        prompt=prompt,
-        tools=RISK_ASSESSOR.tools,
-        model=RISK_ASSESSOR.model,
-        system_prompt=RISK_ASSESSOR.system_prompt,
-        timeout_seconds=RISK_ASSESSOR.timeout_seconds
-    )
-
-    if result.success and result.raw_output:
-        parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
-        if parsed:
-            result.output = parsed
-        else:
-            result.success = False
-            result.error = "JSON parse failed: could not extract structured output"
-
-    return result
\ No newline at end of file
+
+async def run_risk_assessor(
+    research_outputs: List[Dict[str, Any]],
+    analysis_outputs: Optional[List[Dict[str, Any]]] = None,
+    startup_name: str = ""
+) -> AgentResult:
+    """Perform comprehensive risk assessment using all available data."""
+    # Nothing succeeded upstream — an LLM call would assess empty data
+    if not any(output.get("success") for output in research_outputs):
+        return AgentResult(
+            success=False,
+            error="Insufficient input: no successful research outputs to assess",
+            agent_name=RISK_ASSESSOR.name,
+            execution_time_ms=0,
+        )
+
+    # Bucket successful outputs by agent and serialize each bucket once,
+    # instead of one json.dumps per agent plus list juggling.
+    payload = {
+        "research_findings": {
+            output.get("agent", "Unknown"): output.get("output")
+            for output in research_outputs
+            if output.get("success") and output.get("output")
+        },
+    }
+    if analysis_outputs:
+        payload["analysis_findings"] = {
+            output.get("agent", "Unknown"): output.get("output")
+            for output in analysis_outputs
+            if output.get("success") and output.get("output")
+        }
+
+    context = orjson.dumps(payload, default=str).decode()
+    if startup_name:
+        context = f"Startup: {startup_name}\n\n{context}"
+
+    prompt = PROMPT_TEMPLATE.format_map({"context": context})
+
+    async def execute() -> AgentResult:
+        result = await run_agent(
+            agent_name=RISK_ASSESSOR.name,
+            prompt=prompt,
+            tools=RISK_ASSESSOR.tools,
+            model=RISK_ASSESSOR.model,
+            system_prompt=RISK_ASSESSOR.system_prompt,
+            timeout_seconds=RISK_ASSESSOR.timeout_seconds
+        )
+
+        if result.success and result.raw_output:
+            parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
+            if parsed:
+                result.output = parsed
+            else:
+                result.success = False
+                result.error = "JSON parse failed: could not extract structured output"
+
+        return result
+
+    # The context already bucketed only successful findings — hash that
+    # same payload so any upstream change flows into the key
+    key = dependency_key(RISK_ASSESSOR.name, source_version(__file__), startup_name, payload)
+    return await agent_result_cache.get_or_compute(
+        key, ttl=3600, factory=execute, cache_if=lambda r: r.success
+    )
\ No newline at end of file
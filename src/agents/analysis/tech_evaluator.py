@@ -1,20 +1,12 @@
 from ...config.agent_configs import TECH_EVALUATOR
 from typing import Optional, Dict, Any
 from ..base import run_agent, AgentResult, parse_json_from_output
-import asyncio
+from ..cache import agent_result_cache, dependency_key, source_version
 
 """Tech Evaluator Agent - assesses technology and technical defensibility."""
-async def run_tech_evaluator(
-    startup_name: str,
-    startup_description: str,
-    team_analysis: Optional[Dict[str, Any]] = None
-) -> AgentResult:
-    """Evaluate technology and technical defensibility."""
-    team_context = ""
-    if team_analysis:
-        team_context = f"\n## Team Technical Background:\n{_format_team_tech(team_analysis)}"
 
-    prompt = f"""Evaluate the technology and technical defensibility of this startup:
+
+PROMPT_TEMPLATE = """Evaluate the technology and technical defensibility of this startup:
 
 Startup Name: {startup_name}
 Description: {startup_description}
@@ -39,24 +31,50 @@ Format your response as valid JSON:
 }}
 """
 
-    result = await run_agent(
-        agent_name=TECH_EVALUATOR.name,
-        prompt=prompt,
-        tools=TECH_EVALUATOR.tools,
-        model=TECH_EVALUATOR.model,
-        system_prompt=TECH_EVALUATOR.system_prompt,
-        timeout_seconds=TECH_EVALUATOR.timeout_seconds
-    )
 
-    if result.success and result.raw_output:
-        parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
-        if parsed:
-            result.output = parsed
-        else:
-            result.success = False
-            result.error = "JSON parse failed: could not extract structured output"
+async def run_tech_evaluator(
+    startup_name: str,
+    startup_description: str,
+    team_analysis: Optional[Dict[str, Any]] = None
+) -> AgentResult:
+    """Evaluate technology and technical defensibility."""
+    team_context = ""
+    if team_analysis:
+        team_context = f"\n## Team Technical Background:\n{_format_team_tech(team_analysis)}"
+
+    prompt = PROMPT_TEMPLATE.format_map({
+        "startup_name": startup_name,
+        "startup_description": startup_description,
+        "team_context": team_context,
+    })
+
+    async def execute() -> AgentResult:
+        result = await run_agent(
+            agent_name=TECH_EVALUATOR.name,
+            prompt=prompt,
+            tools=TECH_EVALUATOR.tools,
+            model=TECH_EVALUATOR.model,
+            system_prompt=TECH_EVALUATOR.system_prompt,
+            timeout_seconds=TECH_EVALUATOR.timeout_seconds
+        )
+
+        if result.success and result.raw_output:
+            parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
+            if parsed:
+                result.output = parsed
+            else:
+                result.success = False
+                result.error = "JSON parse failed: could not extract structured output"
 
-    return result
+        return result
+
+    key = dependency_key(
+        TECH_EVALUATOR.name, source_version(__file__),
+        startup_name, startup_description, team_analysis,
+    )
+    return await agent_result_cache.get_or_compute(
+        key, ttl=3600, factory=execute, cache_if=lambda r: r.success
+    )
 
 
 def _format_team_tech(team_analysis: Dict[str, Any]) -> str:
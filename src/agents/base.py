@@ -1,14 +1,35 @@
 import asyncio
+import functools
+import hashlib
+import os
 import time
-import json
+import re
 import traceback
 import logging
 import sys
 from typing import List, Optional, Any
-from pydantic import BaseModel
+
+import orjson
+from collections import OrderedDict, deque
+from contextlib import aclosing
 from dataclasses import dataclass, field
 
 from ..config.settings import get_model_id
+from .ratelimit import AGENT_BUCKET, ConcurrencyLimiter
+
+# Imported once at module load instead of per run_agent call; a missing
+# SDK surfaces as a failed AgentResult at call time, same as before.
+try:
+    from claude_agent_sdk import (
+        query,
+        ClaudeAgentOptions,
+        AssistantMessage,
+        ResultMessage,
+        TextBlock,
+        ToolUseBlock,
+    )
+except ImportError:
+    query = None
 
 # Configure structured logging
 logging.basicConfig(
@@ -18,27 +39,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger('agent')
 
+# Backpressure for outbound LLM calls: with many jobs each fanning out to
+# multiple agents, unbounded concurrency hits provider rate limits and
+# head-of-line blocks everything. All run_agent calls share this pool;
+# past AGENT_MAX_QUEUED waiters, new calls fail fast instead of piling up.
+_AGENT_POOL = ConcurrencyLimiter(
+    max_running=int(os.getenv("AGENT_MAX_INFLIGHT", "16")),
+    max_queued=int(os.getenv("AGENT_MAX_QUEUED", "64")),
+)
+
+# Longest silence tolerated between streamed messages. A stream that goes
+# quiet is usually stuck on one slow tool call; aborting at the step budget
+# instead of the full wall-clock budget converts dead wait into retry time.
+_STEP_TIMEOUT_SECONDS = int(os.getenv("AGENT_STEP_TIMEOUT", "30"))
+
+# "summary" (default) logs only start/completion per agent; "verbose"
+# restores the per-turn and per-tool logging. With dozens of concurrent
+# agents the per-message formatting and stdout contention are real costs.
+_TRACE_VERBOSE = os.getenv("AGENT_TRACE_LEVEL", "summary").lower() == "verbose"
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionTrace:
     """Tracks execution state - survives timeout for debugging."""
     turns: int = 0
-    tool_calls: List[str] = field(default_factory=list)
+    # Bounded: a runaway agent looping on tools would otherwise grow this
+    # (and its formatted entries) without limit
+    tool_calls: deque = field(default_factory=lambda: deque(maxlen=200))
+    dropped_tool_calls: int = 0
     tokens_input: int = 0
     tokens_output: int = 0
     last_activity: str = "initialized"
+    # Monotonic timestamps: wall-clock (time.time) can jump under NTP skew
+    started_at: float = 0.0
     last_activity_time: float = 0.0
-    partial_output: str = ""
-
-    def log_turn(self, message_type: str, elapsed: float):
+    # Accumulated as chunks; str += through an attribute defeats CPython's
+    # in-place concat optimization and goes quadratic on long outputs.
+    partial_output_chunks: List[str] = field(default_factory=list)
+    # Sliding window of recent tool-call fingerprints: agents sometimes loop,
+    # re-issuing the same tool with identical arguments and burning tokens.
+    _tool_fingerprints: "OrderedDict[str, int]" = field(default_factory=OrderedDict)
+    duplicate_tool_calls: int = 0
+
+    @property
+    def partial_output(self) -> str:
+        return "".join(self.partial_output_chunks)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    def log_turn(self, message_type: str):
         self.turns += 1
         self.last_activity = f"turn_{self.turns}_{message_type}"
-        self.last_activity_time = elapsed
-
-    def log_tool(self, tool_name: str, tool_input: dict, elapsed: float):
-        self.tool_calls.append(f"{tool_name}({json.dumps(tool_input)[:100]})")
+        self.last_activity_time = time.monotonic()
+
+    def log_tool(self, tool_name: str, tool_input: dict):
+        if len(self.tool_calls) == self.tool_calls.maxlen:
+            self.dropped_tool_calls += 1
+        if _TRACE_VERBOSE:
+            args = orjson.dumps(tool_input, default=str)[:100].decode('utf-8', errors='replace')
+            self.tool_calls.append(f"{tool_name}({args})")
+        else:
+            # Skip serializing the args — the name alone is enough for summaries
+            self.tool_calls.append(tool_name)
         self.last_activity = f"tool_call:{tool_name}"
-        self.last_activity_time = elapsed
+        self.last_activity_time = time.monotonic()
+
+        fp = hashlib.blake2b(
+            tool_name.encode() + b"|" +
+            orjson.dumps(tool_input, option=orjson.OPT_SORT_KEYS, default=str),
+            digest_size=8,
+        ).hexdigest()
+        count = self._tool_fingerprints.get(fp, 0) + 1
+        self._tool_fingerprints[fp] = count
+        self._tool_fingerprints.move_to_end(fp)
+        # 10-slot window: only loops within recent history count as loops
+        if len(self._tool_fingerprints) > 10:
+            self._tool_fingerprints.popitem(last=False)
+        if count > 1:
+            self.duplicate_tool_calls += 1
+            if count == 3:
+                logger.warning(
+                    f"Repeated tool call detected: {tool_name} invoked 3x "
+                    f"with identical arguments"
+                )
 
     def log_tokens(self, input_tokens: int, output_tokens: int):
         self.tokens_input += input_tokens
@@ -46,29 +131,100 @@ class ExecutionTrace:
 
     def timeout_summary(self) -> str:
         return (
-            f"Timed out during '{self.last_activity}' at t={self.last_activity_time:.1f}s | "
+            f"Timed out during '{self.last_activity}' "
+            f"at t={self.last_activity_time - self.started_at:.1f}s | "
             f"turns={self.turns} | tools={len(self.tool_calls)} | "
             f"tokens_in={self.tokens_input} tokens_out={self.tokens_output}"
         )
 
 
-class AgentResult(BaseModel):
+# Plain dataclass rather than a pydantic model: every field is produced by
+# this module, so validation on construction is pure overhead, and slots
+# keep the many instances a fanout creates cheap.
+@dataclass(slots=True)
+class AgentResult:
     success: bool
     output: Optional[Any] = None
     raw_output: Optional[str] = None
     error: Optional[str] = None
-    agent_name: str
-    execution_time_ms: int
+    agent_name: str = ""
+    execution_time_ms: int = 0
     # Production diagnostics
     turns: int = 0
-    tool_calls: List[str] = []
+    tool_calls: List[str] = field(default_factory=list)
     tokens_input: int = 0
     tokens_output: int = 0
     timeout_context: Optional[str] = None  # What was happening when it timed out
+    duplicate_tool_calls: int = 0  # Identical (tool, args) re-invocations seen
     # Enhanced error diagnostics
     error_type: Optional[str] = None  # Exception class name
     error_traceback: Optional[str] = None  # Full traceback for debugging
 
+    def to_dict(self) -> dict:
+        """Plain dict for downstream JSON serialization."""
+        return {
+            "success": self.success,
+            "output": self.output,
+            "raw_output": self.raw_output,
+            "error": self.error,
+            "agent_name": self.agent_name,
+            "execution_time_ms": self.execution_time_ms,
+            "turns": self.turns,
+            "tool_calls": self.tool_calls,
+            "tokens_input": self.tokens_input,
+            "tokens_output": self.tokens_output,
+            "timeout_context": self.timeout_context,
+            "duplicate_tool_calls": self.duplicate_tool_calls,
+            "error_type": self.error_type,
+            "error_traceback": self.error_traceback,
+        }
+
+
+_STREAM_SENTINEL = object()
+
+
+async def _buffered(stream, maxsize: int = 8):
+    """
+    Decouple SDK network reads from per-message consumer work.
+
+    An async generator only advances while its consumer awaits it, so time
+    spent tracing one message serializes with streaming the next. A
+    background pump keeps reading into a bounded queue (maxsize gives
+    backpressure) while the consumer processes the previous message.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+
+    async def pump():
+        try:
+            async for item in stream:
+                await queue.put(item)
+        finally:
+            # Enqueued even when the stream raised, so the consumer wakes
+            # up, breaks, and awaits the task to surface the exception
+            await queue.put(_STREAM_SENTINEL)
+
+    task = asyncio.create_task(pump())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_SENTINEL:
+                break
+            yield item
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        # Close the wrapped stream too: cancelling the pump throws into it
+        # at its await point, but an explicit aclose() is the documented
+        # way to guarantee its cleanup (subprocess teardown) has run
+        aclose = getattr(stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
 
 async def run_agent(
     agent_name: str,
@@ -76,35 +232,50 @@ async def run_agent(
     tools: Optional[List[str]] = None,
     model: str = "sonnet",
     system_prompt: Optional[str] = None,
-    timeout_seconds: int = 60
+    timeout_seconds: int = 60,
+    early_stop_on_json: bool = True,
+    max_tool_iterations: int = 0
 ) -> AgentResult:
-    start_time = time.time()
+    """
+    Run a single agent and return its result.
+
+    With early_stop_on_json (the default), the stream is abandoned as soon
+    as the accumulated text contains a parseable JSON object — models often
+    keep explaining after emitting the JSON, and that trailing prose costs
+    tokens and latency for output we discard. Agents whose real product is
+    free text (e.g. the report generator) must pass False.
+
+    max_tool_iterations (0 = unlimited) hard-caps tool invocations: the run
+    is cut off when the model starts tool call N+1, so an agent that uses
+    exactly N tools and then answers is unaffected. This bounds worst-case
+    latency when the model ignores the "1-2 searches maximum" prompt hint.
+    """
+    start_time = time.monotonic()
     model_id = get_model_id(model)
 
+    # Level checks hoisted out of the hot loop: an f-string log line is
+    # built before the filter rejects it, so guard with booleans instead
+    log_info = logger.isEnabledFor(logging.INFO)
+    log_debug = logger.isEnabledFor(logging.DEBUG)
+
     # Track state OUTSIDE execute() so we have it on timeout
-    trace = ExecutionTrace()
+    trace = ExecutionTrace(started_at=start_time, last_activity_time=start_time)
 
     # Capture stderr from CLI subprocess - defined outside try so it survives exceptions
     stderr_lines: List[str] = []
 
     try:
-        from claude_agent_sdk import (
-            query,
-            ClaudeAgentOptions,
-            AssistantMessage,
-            ResultMessage,
-            TextBlock,
-            ToolUseBlock
-        )
+        if query is None:
+            raise ImportError("claude_agent_sdk is not installed")
 
         # Callback to capture stderr from the CLI subprocess
         def stderr_callback(line: str):
             stderr_lines.append(line)
             # Also log immediately so we see errors in real-time
             if "error" in line.lower() or "exception" in line.lower() or "traceback" in line.lower():
-                logger.error(f"[{agent_name}] CLI stderr: {line}")
-            else:
-                logger.debug(f"[{agent_name}] CLI stderr: {line}")
+                logger.error("[%s] CLI stderr: %s", agent_name, line)
+            elif log_debug:
+                logger.debug("[%s] CLI stderr: %s", agent_name, line)
 
         options = ClaudeAgentOptions(
             model=model_id,
@@ -113,57 +284,108 @@ async def run_agent(
             system_prompt=system_prompt,
             cwd="/tmp",
             stderr=stderr_callback,  # Capture actual stderr from CLI
-            extra_args={"debug-to-stderr": None},  # Enable CLI debug mode
+            # CLI debug mode floods stderr (and our callback) with output
+            # we discard unless debug logging is actually on
+            extra_args={"debug-to-stderr": None} if log_debug else {},
         )
 
         async def execute():
-            async for message in query(prompt=prompt, options=options):
-                elapsed = time.time() - start_time
-                message_type = type(message).__name__
-                trace.log_turn(message_type, elapsed)
-
-                # Log every turn
-                logger.info(f"[{agent_name}] t={elapsed:.1f}s turn={trace.turns} {message_type}")
-
-                if isinstance(message, AssistantMessage):
-                    # Extract token usage if available
-                    if hasattr(message, 'usage') and message.usage:
-                        trace.log_tokens(
-                            getattr(message.usage, 'input_tokens', 0),
-                            getattr(message.usage, 'output_tokens', 0)
-                        )
-
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            trace.partial_output += block.text
-                        elif isinstance(block, ToolUseBlock):
-                            tool_input = getattr(block, 'input', {})
-                            trace.log_tool(block.name, tool_input, elapsed)
-                            logger.debug(f"[{agent_name}] Tool: {block.name}")
-                            # Log what's being searched/fetched
-                            if 'query' in tool_input:
-                                logger.debug(f"[{agent_name}]   Query: {tool_input['query'][:80]}")
-                            elif 'url' in tool_input:
-                                logger.debug(f"[{agent_name}]   URL: {tool_input['url'][:80]}")
-
-                elif isinstance(message, ResultMessage):
-                    # Extract final token usage if available
-                    if hasattr(message, 'usage') and message.usage:
-                        trace.log_tokens(
-                            getattr(message.usage, 'input_tokens', 0),
-                            getattr(message.usage, 'output_tokens', 0)
+            # aclosing guarantees the buffered stream's cleanup (pump
+            # cancellation and SDK generator close) runs even when wait_for
+            # cancels this task mid-iteration — otherwise a timed-out agent
+            # can leak its CLI subprocess
+            async with aclosing(_buffered(query(prompt=prompt, options=options))) as stream:
+                it = aiter(stream)
+                while True:
+                    remaining = timeout_seconds - trace.elapsed
+                    if remaining <= 0:
+                        raise asyncio.TimeoutError
+                    try:
+                        message = await asyncio.wait_for(
+                            anext(it), timeout=min(_STEP_TIMEOUT_SECONDS, remaining)
                         )
-                    if message.result and not trace.partial_output:
-                        trace.partial_output = message.result
-
-        # Execute with timeout
-        await asyncio.wait_for(execute(), timeout=timeout_seconds)
-
-        elapsed_ms = int((time.time() - start_time) * 1000)
-        logger.info(
-            f"[{agent_name}] COMPLETE: {trace.turns} turns, {len(trace.tool_calls)} tools, "
-            f"{trace.tokens_input}+{trace.tokens_output} tokens"
-        )
+                    except StopAsyncIteration:
+                        break
+                    except asyncio.TimeoutError:
+                        # Record that it was a stall, not budget exhaustion, then
+                        # let the outer timeout handler build the result
+                        trace.last_activity = f"step_timeout_on_{trace.last_activity}"
+                        raise
+
+                    message_type = type(message).__name__
+                    trace.log_turn(message_type)
+
+                    if _TRACE_VERBOSE and log_info:
+                        logger.info("[%s] t=%.1fs turn=%d %s",
+                                    agent_name, trace.elapsed, trace.turns, message_type)
+
+                    if isinstance(message, AssistantMessage):
+                        # Extract token usage if available (single lookup; hasattr
+                        # is a try/except under the hood and this loop is hot)
+                        usage = getattr(message, 'usage', None)
+                        if usage is not None:
+                            trace.log_tokens(
+                                getattr(usage, 'input_tokens', 0),
+                                getattr(usage, 'output_tokens', 0)
+                            )
+
+                        for block in message.content:
+                            if isinstance(block, TextBlock):
+                                trace.partial_output_chunks.append(block.text)
+                                # Only rescan when this chunk could have closed
+                                # an object — '}' is a cheap precondition
+                                if early_stop_on_json and '}' in block.text:
+                                    joined = trace.partial_output
+                                    for start_idx, end_idx in _iter_json_spans(joined):
+                                        try:
+                                            orjson.loads(joined[start_idx:end_idx])
+                                        except orjson.JSONDecodeError:
+                                            continue
+                                        trace.last_activity = "early_stop_on_json"
+                                        return
+                            elif isinstance(block, ToolUseBlock):
+                                tool_input = getattr(block, 'input', {})
+                                trace.log_tool(block.name, tool_input)
+                                total_tool_calls = len(trace.tool_calls) + trace.dropped_tool_calls
+                                if max_tool_iterations and total_tool_calls > max_tool_iterations:
+                                    logger.warning(
+                                        "[%s] Tool cap hit: call %d exceeds limit of %d, cutting off",
+                                        agent_name, total_tool_calls, max_tool_iterations
+                                    )
+                                    trace.last_activity = "tool_limit_reached"
+                                    return
+                                if _TRACE_VERBOSE and log_debug:
+                                    logger.debug("[%s] Tool: %s", agent_name, block.name)
+                                    # Log what's being searched/fetched
+                                    if 'query' in tool_input:
+                                        logger.debug("[%s]   Query: %s", agent_name, tool_input['query'][:80])
+                                    elif 'url' in tool_input:
+                                        logger.debug("[%s]   URL: %s", agent_name, tool_input['url'][:80])
+
+                    elif isinstance(message, ResultMessage):
+                        # Extract final token usage if available
+                        usage = getattr(message, 'usage', None)
+                        if usage is not None:
+                            trace.log_tokens(
+                                getattr(usage, 'input_tokens', 0),
+                                getattr(usage, 'output_tokens', 0)
+                            )
+                        if message.result and not trace.partial_output_chunks:
+                            trace.partial_output_chunks.append(message.result)
+
+        # Execute with timeout, under the global in-flight cap and the
+        # shared start-rate bucket (concurrency and QPS are separate knobs)
+        async with _AGENT_POOL:
+            await AGENT_BUCKET.acquire()
+            await asyncio.wait_for(execute(), timeout=timeout_seconds)
+
+        elapsed_ms = int((time.monotonic() - start_time) * 1000)
+        if log_info:
+            logger.info(
+                "[%s] COMPLETE: %d turns, %d tools, %d+%d tokens",
+                agent_name, trace.turns, len(trace.tool_calls),
+                trace.tokens_input, trace.tokens_output,
+            )
 
         return AgentResult(
             success=True,
@@ -173,32 +395,44 @@ async def run_agent(
             agent_name=agent_name,
             execution_time_ms=elapsed_ms,
             turns=trace.turns,
-            tool_calls=trace.tool_calls,
+            tool_calls=list(trace.tool_calls),
             tokens_input=trace.tokens_input,
             tokens_output=trace.tokens_output,
+            duplicate_tool_calls=trace.duplicate_tool_calls,
         )
 
     except asyncio.TimeoutError:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = int((time.monotonic() - start_time) * 1000)
         timeout_context = trace.timeout_summary()
         logger.warning(f"[{agent_name}] TIMEOUT: {timeout_context}")
 
         return AgentResult(
             success=False,
             output=None,
-            raw_output=trace.partial_output if trace.partial_output else None,
+            raw_output=trace.partial_output if trace.partial_output_chunks else None,
             error=f"Timeout after {timeout_seconds}s",
             agent_name=agent_name,
             execution_time_ms=elapsed_ms,
             turns=trace.turns,
-            tool_calls=trace.tool_calls,
+            tool_calls=list(trace.tool_calls),
             tokens_input=trace.tokens_input,
             tokens_output=trace.tokens_output,
+            duplicate_tool_calls=trace.duplicate_tool_calls,
             timeout_context=timeout_context,
         )
 
+    except asyncio.CancelledError:
+        # Caller-driven cancellation (shutdown, gather teardown): log the
+        # partial state for debugging but always re-raise — swallowing
+        # cancellation breaks structured concurrency upstream
+        logger.warning(
+            "[%s] CANCELLED during '%s' after %d turns",
+            agent_name, trace.last_activity, trace.turns,
+        )
+        raise
+
     except Exception as e:
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = int((time.monotonic() - start_time) * 1000)
         exc_type = type(e).__name__
         exc_traceback = traceback.format_exc()
 
@@ -218,19 +452,63 @@ async def run_agent(
         return AgentResult(
             success=False,
             output=None,
-            raw_output=trace.partial_output if trace.partial_output else None,
+            raw_output=trace.partial_output if trace.partial_output_chunks else None,
             error=full_error,
             error_type=exc_type,
             error_traceback=exc_traceback,
             agent_name=agent_name,
             execution_time_ms=elapsed_ms,
             turns=trace.turns,
-            tool_calls=trace.tool_calls,
+            tool_calls=list(trace.tool_calls),
             tokens_input=trace.tokens_input,
             tokens_output=trace.tokens_output,
+            duplicate_tool_calls=trace.duplicate_tool_calls,
         )
     
 
+# Compiled once at import — agent outputs run through this on every call
+_FENCE_PATTERN = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+
+
+def _iter_json_spans(s: str):
+    """
+    Yield (start, end) offsets of balanced top-level {...} spans in s.
+
+    Single pass with a brace-depth counter and a minimal string-state
+    machine (skips braces inside JSON strings, honoring backslash
+    escapes), so candidates are provably balanced — no regex
+    backtracking and no speculative slicing of huge unbalanced spans.
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    for i, ch in enumerate(s):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}':
+            if depth > 0:
+                depth -= 1
+                if depth == 0:
+                    yield (start, i + 1)
+
+
+# Outputs above this size bypass the parse cache so cached copies of the
+# raw string can't pin megabytes of memory.
+_PARSE_CACHE_MAX_BYTES = 1 << 20
+
+
 def parse_json_from_output(output: str, agent_name: str = "unknown") -> Optional[dict]:
     """
     Parse JSON from agent output with detailed error logging.
@@ -240,38 +518,73 @@ def parse_json_from_output(output: str, agent_name: str = "unknown") -> Optional
     2. Extract from markdown code blocks
     3. Find JSON object in text
 
+    Parsing goes through orjson (C implementation, 2-5x faster than
+    stdlib json on the tens-of-KB payloads agents return). Results are
+    memoized per output digest, so re-parsing identical raw_output on
+    orchestration retries is an O(1) cache hit.
+
     Returns None and logs warnings if all strategies fail.
     """
     if not output:
         logger.warning(f"[{agent_name}] JSON parse failed: empty output")
         return None
 
+    # Fast path: a well-behaved agent returns bare JSON, which needs none
+    # of the hashing/caching/fallback machinery below. Scan past leading
+    # whitespace without allocating a stripped copy.
+    i = 0
+    n = len(output)
+    while i < n and output[i] in ' \t\r\n':
+        i += 1
+    if i < n and output[i] in '{[':
+        try:
+            return orjson.loads(output)
+        except orjson.JSONDecodeError:
+            pass  # prose or truncation after the opening bracket — fall through
+
+    if len(output) > _PARSE_CACHE_MAX_BYTES:
+        return _parse_strategies(output, agent_name)
+
+    digest = hashlib.blake2b(output.encode('utf-8'), digest_size=16).digest()
+    cached = _parse_cached(digest, output, agent_name)
+    return orjson.loads(cached) if cached is not None else None
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(digest: bytes, output: str, agent_name: str) -> Optional[bytes]:
+    """Digest-keyed memo of the parse strategies (serialized, cache-safe)."""
+    result = _parse_strategies(output, agent_name)
+    return orjson.dumps(result) if result is not None else None
+
+
+def _parse_strategies(output: str, agent_name: str) -> Optional[dict]:
     errors = []  # Collect all parsing errors for debugging
 
     # Strategy 1: Try direct JSON parse
     try:
-        return json.loads(output)
-    except json.JSONDecodeError as e:
+        return orjson.loads(output)
+    except orjson.JSONDecodeError as e:
         errors.append(f"Direct parse: {e.msg} at position {e.pos}")
 
-    # Strategy 2: Try to extract from markdown code block
-    import re
-    json_pattern = r'```(?:json)?\s*([\s\S]*?)```'
-    matches = re.findall(json_pattern, output)
-    for i, match in enumerate(matches):
+    # Strategy 2: Try to extract from markdown code block. finditer keeps
+    # this lazy — no list of all fence bodies when the first one parses.
+    for i, match in enumerate(_FENCE_PATTERN.finditer(output)):
         try:
-            return json.loads(match.strip())
-        except json.JSONDecodeError as e:
+            return orjson.loads(match.group(1).strip())
+        except orjson.JSONDecodeError as e:
             errors.append(f"Code block {i}: {e.msg} at position {e.pos}")
 
-    # Strategy 3: Try to find JSON object in text
-    start_idx = output.find('{')
-    end_idx = output.rfind('}')
-    if start_idx != -1 and end_idx != -1 and end_idx > start_idx:
+    # Strategy 3: Try balanced JSON object spans found in the text. Messy
+    # outputs can contain several {...} candidates (example snippets, tool
+    # echoes) before the real object; bound the attempts to cap CPU.
+    for candidates, (start_idx, end_idx) in enumerate(_iter_json_spans(output)):
+        if candidates == 5:
+            errors.append("Span scan: gave up after 5 balanced candidates")
+            break
         try:
-            return json.loads(output[start_idx:end_idx + 1])
-        except json.JSONDecodeError as e:
-            errors.append(f"Extracted object: {e.msg} at position {e.pos}")
+            return orjson.loads(output[start_idx:end_idx])
+        except orjson.JSONDecodeError as e:
+            errors.append(f"Span at {start_idx}: {e.msg} at position {e.pos}")
 
     # All strategies failed - log details
     output_preview = output[:200] + "..." if len(output) > 200 else output
@@ -280,4 +593,132 @@ def parse_json_from_output(output: str, agent_name: str = "unknown") -> Optional
         f"  Errors: {errors}\n"
         f"  Output preview: {output_preview}"
     )
-    return None
\ No newline at end of file
+    return None
+
+def split_batch_results(batch: AgentResult, count: int, agent_name: str) -> List[AgentResult]:
+    """
+    Fan a single batched agent response back out into per-item results.
+
+    Batch prompts ask for a JSON array with one object per input, in input
+    order. Models sometimes wrap the array in a single-key object; that is
+    unwrapped here. Items missing from a short or malformed response become
+    failed AgentResults so callers always get exactly `count` entries.
+    """
+    if not (batch.success and batch.raw_output):
+        return [
+            AgentResult(
+                success=False,
+                error=batch.error or "Batch call failed",
+                agent_name=agent_name,
+                execution_time_ms=batch.execution_time_ms,
+            )
+            for _ in range(count)
+        ]
+
+    parsed = parse_json_from_output(batch.raw_output, agent_name=agent_name)
+    if isinstance(parsed, dict):
+        for value in parsed.values():
+            if isinstance(value, list):
+                parsed = value
+                break
+    if not isinstance(parsed, list):
+        return [
+            AgentResult(
+                success=False,
+                error="Batch parse failed: expected a JSON array",
+                agent_name=agent_name,
+                execution_time_ms=batch.execution_time_ms,
+            )
+            for _ in range(count)
+        ]
+
+    results: List[AgentResult] = []
+    for i in range(count):
+        item = parsed[i] if i < len(parsed) else None
+        if isinstance(item, dict):
+            results.append(AgentResult(
+                success=True,
+                output=item,
+                raw_output=batch.raw_output,
+                agent_name=agent_name,
+                execution_time_ms=batch.execution_time_ms,
+                tokens_input=batch.tokens_input,
+                tokens_output=batch.tokens_output,
+            ))
+        else:
+            results.append(AgentResult(
+                success=False,
+                error=f"Batch response missing item {i}",
+                agent_name=agent_name,
+                execution_time_ms=batch.execution_time_ms,
+            ))
+    return results
+
+
+def validate_output_keys(result: AgentResult, required_keys: List[str]) -> AgentResult:
+    """
+    Fail a result whose parsed output is missing required top-level keys.
+
+    The CLI-based SDK offers no server-side response schema, so structural
+    drift (the model answering with prose keys or a different shape) is
+    caught here instead — an explicit failure the workflow can retry beats
+    a half-shaped dict propagating into analysis and synthesis.
+    """
+    if not (required_keys and result.success and isinstance(result.output, dict)):
+        return result
+    missing = [key for key in required_keys if key not in result.output]
+    if missing:
+        result.success = False
+        result.error = f"Schema validation failed: missing keys {missing}"
+    return result
+
+
+async def run_agent_streaming(
+    agent_name: str,
+    prompt: str,
+    tools: Optional[List[str]] = None,
+    model: str = "sonnet",
+    system_prompt: Optional[str] = None,
+    timeout_seconds: int = 60
+):
+    """
+    Stream an agent's text output as it arrives.
+
+    Yields text chunks so callers can start consuming (UI previews,
+    downstream stages) while the model is still generating, instead of
+    waiting for the full completion. No trace/diagnostic plumbing — use
+    run_agent when a structured AgentResult is needed.
+    """
+    if query is None:
+        raise ImportError("claude_agent_sdk is not installed")
+
+    model_id = get_model_id(model)
+    options = ClaudeAgentOptions(
+        model=model_id,
+        allowed_tools=tools if tools else [],
+        permission_mode="bypassPermissions",
+        system_prompt=system_prompt,
+        cwd="/tmp",
+    )
+
+    deadline = time.monotonic() + timeout_seconds
+    async with _AGENT_POOL:
+        await AGENT_BUCKET.acquire()
+        async with aclosing(query(prompt=prompt, options=options)) as stream:
+            it = aiter(stream)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(
+                        f"[{agent_name}] streaming timed out after {timeout_seconds}s"
+                    )
+                try:
+                    message = await asyncio.wait_for(
+                        anext(it), timeout=min(_STEP_TIMEOUT_SECONDS, remaining)
+                    )
+                except StopAsyncIteration:
+                    break
+                if isinstance(message, AssistantMessage):
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            yield block.text
@@ -0,0 +1,166 @@
+"""Shared in-process TTL cache for agent results.
+
+Research agents are pure functions of (agent, startup_name, startup_description)
+over their TTL window, so repeat requests for the same startup can skip the
+LLM round-trip entirely. The cache is singleflight: concurrent callers for the
+same key share one in-flight computation instead of stampeding the SDK.
+"""
+
+import asyncio
+import functools
+import hashlib
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+
+
+@functools.lru_cache(maxsize=None)
+def source_version(path: str) -> str:
+    """Content hash of an agent's source file, for use in cache keys.
+
+    Prompt templates live in the agent modules, so hashing the file makes
+    cached results invalidate the moment a prompt is edited — no manually
+    bumped version constant to forget. Hashed once per process per file.
+    """
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+
+
+def dependency_key(agent_name: str, version: str, *deps: Any) -> str:
+    """Cache key hashing an agent's full input chain.
+
+    Research agents key on plain strings, but analysis agents consume
+    upstream dict payloads — hashing the serialized dependencies means an
+    edit anywhere upstream (a refreshed profile, different market data)
+    produces a different key, while identical inputs hit. Hashing is
+    O(ms) against the O(seconds) agent call it can save.
+    """
+    payload = orjson.dumps(
+        (agent_name, version, deps),
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+class AsyncTTLCache:
+    """Dict-backed TTL cache with per-key locks to stampede-protect factories."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _get_fresh(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    async def get_or_compute(
+        self,
+        key: str,
+        ttl: float,
+        factory: Callable[[], Awaitable[Any]],
+        cache_if: Callable[[Any], bool] = lambda _: True,
+    ) -> Any:
+        """Return the cached value for key, computing and storing it on a miss.
+
+        Only results passing cache_if are stored, so transient failures are
+        retried on the next call instead of being pinned for the full TTL.
+        """
+        if os.getenv("AGENT_CACHE_DISABLE") == "1":
+            return await factory()
+
+        value = self._get_fresh(key)
+        if value is not None:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another caller may have populated the entry while we waited
+            value = self._get_fresh(key)
+            if value is not None:
+                return value
+
+            value = self._disk_load(key)
+            if value is not None:
+                self._entries[key] = (time.monotonic() + ttl, value)
+                return value
+
+            value = await factory()
+            if cache_if(value):
+                self._entries[key] = (time.monotonic() + ttl, value)
+                self._disk_store(key, value, ttl)
+            return value
+
+    # Disk-layer hooks: no-ops here, overridden by PersistentAgentCache
+    def _disk_load(self, key: str) -> Optional[Any]:
+        return None
+
+    def _disk_store(self, key: str, value: Any, ttl: float) -> None:
+        pass
+
+
+class PersistentAgentCache(AsyncTTLCache):
+    """TTL cache with an orjson-on-disk layer for AgentResult values.
+
+    The in-memory layer dies with the process; the disk layer lets a
+    restarted worker (crash, deploy, preemption) resume a half-finished
+    workflow with its already-computed agent results, and lets iterative
+    prompt work re-run only the agents whose source changed (keys carry
+    source_version). Disk entries use wall-clock expiry since monotonic
+    time is meaningless across processes. Corrupt or unreadable files
+    are treated as misses — this layer is best-effort.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self._directory = directory
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+
+    def _disk_load(self, key: str):
+        if not self._directory:
+            return None
+        # Imported here: base.py does not import this module, so the late
+        # import only defends against future layering changes
+        from .base import AgentResult
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = orjson.loads(f.read())
+            if time.time() >= entry["expires_at"]:
+                os.unlink(self._path(key))
+                return None
+            return AgentResult(**entry["result"])
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def _disk_store(self, key: str, value: Any, ttl: float) -> None:
+        if not self._directory:
+            return
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            payload = orjson.dumps({
+                "expires_at": time.time() + ttl,
+                "result": value.to_dict(),
+            })
+            # Write-then-rename so readers never see a partial file
+            tmp_path = self._path(key) + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            pass
+
+
+# Shared across all research and analysis agents in this process.
+# AGENT_CACHE_DIR='' disables the disk layer; AGENT_CACHE_DISABLE=1
+# bypasses caching entirely (the escape hatch for non-deterministic runs).
+agent_result_cache = PersistentAgentCache(os.getenv("AGENT_CACHE_DIR", ".ddcache"))
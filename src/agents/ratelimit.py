@@ -0,0 +1,90 @@
+"""Token-bucket rate limiting for outbound LLM calls.
+
+The shared semaphore in base.py caps how many calls are *in flight*, but
+says nothing about how fast new ones start — a burst of short calls can
+still exceed the provider's requests-per-second limit. The bucket caps
+the start rate; the semaphore caps concurrency. Keeping the two separate
+means neither has to be misconfigured to stand in for the other.
+
+The sleep happens outside the lock. Sleeping while holding it would
+serialize every waiter behind the first sleeper, turning the limiter
+into an accidental mutex over all agents.
+"""
+
+import asyncio
+import os
+import time
+
+
+class TokenBucket:
+    """Async token bucket; rate <= 0 disables limiting entirely."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = float(rate)
+        # Burst allowance: a full bucket lets up to `capacity` calls
+        # start back-to-back before the rate cap kicks in
+        self.capacity = float(capacity) if capacity is not None else max(self.rate, 1.0)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    async def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        if self.rate <= 0:
+            return
+        while True:
+            async with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            # Outside the lock: other callers can check/refill while we
+            # wait, and whoever wakes first re-contends for the token
+            await asyncio.sleep(wait)
+
+
+class ConcurrencyLimitExceeded(RuntimeError):
+    """Raised when a call would exceed the pool's bounded waiting room."""
+
+
+class ConcurrencyLimiter:
+    """Semaphore with a bounded waiting room.
+
+    A bare semaphore caps how many calls run but lets an unbounded number
+    queue behind it — under multi-workflow load that floods memory with
+    pending calls whose results may no longer be wanted by the time they
+    run. Beyond max_queued waiters, acquisition fails fast with
+    ConcurrencyLimitExceeded; run_agent surfaces that as a normal failed
+    result, which the workflow's retry path already knows how to handle.
+    """
+
+    def __init__(self, max_running: int, max_queued: int):
+        self._sem = asyncio.Semaphore(max_running)
+        self.max_queued = max_queued
+        self._waiting = 0
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        if self._waiting >= self.max_queued:
+            raise ConcurrencyLimitExceeded(
+                f"Concurrency pool saturated: {self._waiting} calls already queued "
+                f"(max_queued={self.max_queued})"
+            )
+        self._waiting += 1
+        try:
+            await self._sem.acquire()
+        finally:
+            self._waiting -= 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._sem.release()
+
+
+# Shared by every run_agent call in this process; 0 disables
+AGENT_BUCKET = TokenBucket(rate=float(os.getenv("AGENT_MAX_RPS", "8")))
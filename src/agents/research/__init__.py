@@ -1,13 +1,85 @@
-from .company_profiler import run_company_profiler
+import asyncio
+from typing import Dict
+
+from .company_profiler import run_company_profiler, run_company_profiler_batch
 from .market_researcher import run_market_researcher
 from .competitor_scout import run_competitor_scout
-from .team_investigator import run_team_investigator
-from .news_monitor import run_news_monitor
+from .team_investigator import run_team_investigator, run_team_investigator_batch
+from .news_monitor import run_news_monitor, run_news_monitor_batch
+from ..base import AgentResult
+from ...config.agent_configs import (
+    COMPANY_PROFILER,
+    MARKET_RESEARCHER,
+    COMPETITOR_SCOUT,
+    TEAM_INVESTIGATOR,
+    NEWS_MONITOR,
+)
+
+# Allowance on top of each agent's own timeout before the bundle gives up
+# on it — run_agent enforces the real budget; this is a safety net
+_TIMEOUT_GRACE_SECONDS = 30
+
+
+async def _guarded(name: str, coro, timeout: float) -> AgentResult:
+    """Run one agent; coerce any exception into a failed AgentResult."""
+    try:
+        return await asyncio.wait_for(coro, timeout=timeout)
+    except Exception as exc:
+        return AgentResult(
+            success=False,
+            error=f"{type(exc).__name__}: {exc}",
+            error_type=type(exc).__name__,
+            agent_name=name,
+            execution_time_ms=0,
+        )
+
+
+async def run_research_bundle(startup_name: str, startup_description: str) -> Dict[str, AgentResult]:
+    """
+    Fan out all five research agents concurrently.
+
+    Each agent is dominated by LLM/network wait, so running them together
+    turns the bundle's wall-clock cost from sum(latencies) into
+    max(latency). Every agent runs under its own timeout inside a
+    TaskGroup, and _guarded coerces exceptions into failed AgentResults —
+    one slow or crashing agent never cancels its peers, and callers always
+    get one result per agent, keyed by agent name.
+    """
+    jobs = [
+        ("company_profiler", run_company_profiler(startup_name, startup_description),
+         COMPANY_PROFILER.timeout_seconds),
+        ("market_researcher", run_market_researcher(startup_name, startup_description),
+         MARKET_RESEARCHER.timeout_seconds),
+        ("competitor_scout", run_competitor_scout(startup_name, startup_description),
+         COMPETITOR_SCOUT.timeout_seconds),
+        ("team_investigator", run_team_investigator(startup_name),
+         TEAM_INVESTIGATOR.timeout_seconds),
+        ("news_monitor", run_news_monitor(startup_name),
+         NEWS_MONITOR.timeout_seconds),
+    ]
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = {
+            name: tg.create_task(_guarded(name, coro, timeout + _TIMEOUT_GRACE_SECONDS))
+            for name, coro, timeout in jobs
+        }
+
+    return {name: task.result() for name, task in tasks.items()}
+
+
+# Workflow-facing name for the full fanout
+run_all_research = run_research_bundle
+
 
 __all__ = [
     "run_company_profiler",
+    "run_company_profiler_batch",
     "run_market_researcher",
     "run_competitor_scout",
     "run_team_investigator",
+    "run_team_investigator_batch",
     "run_news_monitor",
-]
\ No newline at end of file
+    "run_news_monitor_batch",
+    "run_research_bundle",
+    "run_all_research",
+]
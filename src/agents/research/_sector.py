@@ -0,0 +1,39 @@
+"""Sector classification for market-level cache sharing.
+
+Market size and competitor data are properties of a vertical, not of one
+startup: two payments companies share essentially the same TAM numbers
+and competitor set. Classifying the description into a coarse sector
+lets market_researcher and competitor_scout cache at that level, so the
+second startup in a vertical skips both agents entirely.
+
+Deliberately conservative: a plain keyword map, first match wins, and
+None when nothing matches — callers fall back to per-startup keys, so an
+unrecognized vertical can never collide with another startup's data.
+"""
+
+from typing import Optional
+
+# Ordered: more specific verticals before catch-alls (a "payments API"
+# startup should classify as fintech, not devtools)
+_SECTOR_KEYWORDS = (
+    ("fintech", ("payment", "banking", "lending", "fintech", "insurtech", "invoicing", "payroll")),
+    ("healthtech", ("healthcare", "health", "medical", "clinic", "patient", "biotech", "pharma")),
+    ("security", ("cybersecurity", "security", "threat detection", "encryption", "compliance monitoring")),
+    ("logistics", ("logistics", "shipping", "freight", "delivery", "supply chain", "fleet")),
+    ("ecommerce", ("e-commerce", "ecommerce", "marketplace", "retail", "storefront")),
+    ("edtech", ("education", "learning platform", "tutoring", "courses", "students")),
+    ("hrtech", ("hiring", "recruiting", "talent", "hr platform", "onboarding")),
+    ("devtools", ("developer", "devops", "api platform", "observability", "ci/cd", "infrastructure")),
+    ("proptech", ("real estate", "property", "housing", "mortgage")),
+)
+
+
+def market_key(description: str) -> Optional[str]:
+    """Classify a startup description into a coarse sector, or None."""
+    if not description:
+        return None
+    text = description.lower()
+    for sector, keywords in _SECTOR_KEYWORDS:
+        if any(keyword in text for keyword in keywords):
+            return sector
+    return None
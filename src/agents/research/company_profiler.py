@@ -1,21 +1,19 @@
-from ..base import run_agent, AgentResult, parse_json_from_output
-from ...config.agent_configs import COMPANY_PROFILER
+import hashlib
+from typing import List, Tuple
 
+from ..base import run_agent, AgentResult, parse_json_from_output, split_batch_results, validate_output_keys
+from ..cache import agent_result_cache, source_version
+from ...config.agent_configs import COMPANY_PROFILER
 
-async def run_company_profiler(startup_name: str, startup_description: str) -> AgentResult:
-    """
-    Research basic company information.
-    ONE task: Find founding year, headquarters, employee count, and business model.
-    """
-    prompt = f"""Research {startup_name}.
+PROMPT_TEMPLATE = """Research {name}.
 
-Company description: {startup_description}
+Company description: {desc}
 
 YOUR TASK: Find basic company facts. Use 1-2 web searches maximum.
 
 Return JSON:
 {{
-    "name": "{startup_name}",
+    "name": "{name}",
     "founded_year": 2010,
     "headquarters": "City, Country",
     "employee_count": "1000-5000",
@@ -24,22 +22,94 @@ Return JSON:
 }}
 """
 
-    result = await run_agent(
-        agent_name=COMPANY_PROFILER.name,
-        prompt=prompt,
-        tools=COMPANY_PROFILER.tools,
-        model=COMPANY_PROFILER.model,
-        system_prompt=COMPANY_PROFILER.system_prompt,
-        timeout_seconds=COMPANY_PROFILER.timeout_seconds,
+
+async def run_company_profiler(startup_name: str, startup_description: str) -> AgentResult:
+    """
+    Research basic company information.
+    ONE task: Find founding year, headquarters, employee count, and business model.
+    """
+    prompt = PROMPT_TEMPLATE.format_map({"name": startup_name, "desc": startup_description})
+
+    async def execute() -> AgentResult:
+        result = await run_agent(
+            agent_name=COMPANY_PROFILER.name,
+            prompt=prompt,
+            tools=COMPANY_PROFILER.tools,
+            model=COMPANY_PROFILER.model,
+            system_prompt=COMPANY_PROFILER.system_prompt,
+            timeout_seconds=COMPANY_PROFILER.timeout_seconds,
+            max_tool_iterations=COMPANY_PROFILER.max_tool_iterations,
+        )
+
+        if result.success and result.raw_output:
+            parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
+            if parsed:
+                result.output = parsed
+            else:
+                # JSON parse failed despite successful execution - mark as failed
+                result.success = False
+                result.error = "JSON parse failed: could not extract structured output"
+
+        return validate_output_keys(result, COMPANY_PROFILER.output_keys)
+
+    key = hashlib.sha1(
+        f"{COMPANY_PROFILER.name}|{source_version(__file__)}|{startup_name}|{startup_description}".encode()
+    ).hexdigest()
+    return await agent_result_cache.get_or_compute(
+        key, ttl=3600, factory=execute, cache_if=lambda r: r.success
     )
 
-    if result.success and result.raw_output:
-        parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
-        if parsed:
-            result.output = parsed
-        else:
-            # JSON parse failed despite successful execution - mark as failed
-            result.success = False
-            result.error = "JSON parse failed: could not extract structured output"
 
-    return result
\ No newline at end of file
+# Beyond ~16 items per call, quality and latency wins both flatten out
+_BATCH_LIMIT = 16
+
+BATCH_PROMPT_TEMPLATE = """Research each startup below.
+
+YOUR TASK: For each startup, find basic company facts. Use 1-2 web searches per startup maximum.
+
+Startups:
+{startups}
+
+Return a JSON array with one object per startup, in the same order:
+[
+    {{
+        "name": "startup name",
+        "founded_year": 2010,
+        "headquarters": "City, Country",
+        "employee_count": "1000-5000",
+        "business_model": "B2B SaaS payments infrastructure",
+        "key_products": ["Payments", "Billing", "Connect"]
+    }}
+]
+"""
+
+
+async def run_company_profiler_batch(startups: List[Tuple[str, str]]) -> List[AgentResult]:
+    """
+    Profile many startups, one LLM call per 16.
+
+    Takes (name, description) pairs. Batching amortizes per-request network
+    and queuing overhead across the whole list; results come back as one
+    AgentResult per startup, in order.
+    """
+    results: List[AgentResult] = []
+    for i in range(0, len(startups), _BATCH_LIMIT):
+        chunk = startups[i:i + _BATCH_LIMIT]
+        numbered = "\n".join(
+            f"{j + 1}) {name}: {desc}" for j, (name, desc) in enumerate(chunk)
+        )
+        batch = await run_agent(
+            agent_name=COMPANY_PROFILER.name,
+            prompt=BATCH_PROMPT_TEMPLATE.format_map({"startups": numbered}),
+            tools=COMPANY_PROFILER.tools,
+            model=COMPANY_PROFILER.model,
+            system_prompt=COMPANY_PROFILER.system_prompt,
+            timeout_seconds=COMPANY_PROFILER.timeout_seconds * len(chunk),
+            max_tool_iterations=COMPANY_PROFILER.max_tool_iterations * len(chunk),
+            early_stop_on_json=False,  # array output: the first {} is not the whole answer
+        )
+        results.extend(
+            validate_output_keys(item, COMPANY_PROFILER.output_keys)
+            for item in split_batch_results(batch, len(chunk), COMPANY_PROFILER.name)
+        )
+    return results
@@ -1,18 +1,14 @@
-from ..base import run_agent, AgentResult, parse_json_from_output
+import hashlib
+
+from ..base import run_agent, AgentResult, parse_json_from_output, validate_output_keys
+from ..cache import agent_result_cache, source_version
+from ._sector import market_key
 from ...config.agent_configs import COMPETITOR_SCOUT
 
 
-async def run_competitor_scout(
-    startup_name: str,
-    startup_description: str
-) -> AgentResult:
-    """
-    Find top competitors only.
-    ONE task: Identify 3-5 main competitors.
-    """
-    prompt = f"""Find competitors for {startup_name}.
+PROMPT_TEMPLATE = """Find competitors for {name}.
 
-Company description: {startup_description}
+Company description: {desc}
 
 YOUR TASK: Identify top 3-5 competitors. Use 1-2 web searches maximum.
 
@@ -28,21 +24,49 @@ Return JSON:
 }}
 """
 
-    result = await run_agent(
-        agent_name=COMPETITOR_SCOUT.name,
-        prompt=prompt,
-        tools=COMPETITOR_SCOUT.tools,
-        model=COMPETITOR_SCOUT.model,
-        system_prompt=COMPETITOR_SCOUT.system_prompt,
-        timeout_seconds=COMPETITOR_SCOUT.timeout_seconds,
-    )
 
-    if result.success and result.raw_output:
-        parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
-        if parsed:
-            result.output = parsed
-        else:
-            result.success = False
-            result.error = "JSON parse failed: could not extract structured output"
+async def run_competitor_scout(
+    startup_name: str,
+    startup_description: str
+) -> AgentResult:
+    """
+    Find top competitors only.
+    ONE task: Identify 3-5 main competitors.
+    """
+    prompt = PROMPT_TEMPLATE.format_map({"name": startup_name, "desc": startup_description})
+
+    async def execute() -> AgentResult:
+        result = await run_agent(
+            agent_name=COMPETITOR_SCOUT.name,
+            prompt=prompt,
+            tools=COMPETITOR_SCOUT.tools,
+            model=COMPETITOR_SCOUT.model,
+            system_prompt=COMPETITOR_SCOUT.system_prompt,
+            timeout_seconds=COMPETITOR_SCOUT.timeout_seconds,
+            max_tool_iterations=COMPETITOR_SCOUT.max_tool_iterations,
+        )
+
+        if result.success and result.raw_output:
+            parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
+            if parsed:
+                result.output = parsed
+            else:
+                result.success = False
+                result.error = "JSON parse failed: could not extract structured output"
 
-    return result
\ No newline at end of file
+        return validate_output_keys(result, COMPETITOR_SCOUT.output_keys)
+
+    # Market data is a property of the vertical, not the startup: when the
+    # description classifies into a known sector, cache at sector scope
+    # (longer TTL — markets move slower than companies) so peers in the
+    # same vertical share the result. Unclassified descriptions keep
+    # per-startup keys and can never collide.
+    sector = market_key(startup_description)
+    scope = sector or f"{startup_name}|{startup_description}"
+    key = hashlib.sha1(
+        f"{COMPETITOR_SCOUT.name}|{source_version(__file__)}|{scope}".encode()
+    ).hexdigest()
+    return await agent_result_cache.get_or_compute(
+        key, ttl=7 * 86400 if sector else 3600,
+        factory=execute, cache_if=lambda r: r.success
+    )
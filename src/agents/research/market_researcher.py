@@ -1,18 +1,14 @@
-from ..base import run_agent, AgentResult, parse_json_from_output
+import hashlib
+
+from ..base import run_agent, AgentResult, parse_json_from_output, validate_output_keys
+from ..cache import agent_result_cache, source_version
+from ._sector import market_key
 from ...config.agent_configs import MARKET_RESEARCHER
 
 
-async def run_market_researcher(
-    startup_name: str,
-    startup_description: str
-) -> AgentResult:
-    """
-    Research market size only.
-    ONE task: Find TAM/SAM/SOM and growth rate.
-    """
-    prompt = f"""Research market size for {startup_name}.
+PROMPT_TEMPLATE = """Research market size for {name}.
 
-Company description: {startup_description}
+Company description: {desc}
 
 YOUR TASK: Find market size numbers. Use 1-2 web searches maximum.
 
@@ -27,21 +23,49 @@ Return JSON:
 }}
 """
 
-    result = await run_agent(
-        agent_name=MARKET_RESEARCHER.name,
-        prompt=prompt,
-        tools=MARKET_RESEARCHER.tools,
-        model=MARKET_RESEARCHER.model,
-        system_prompt=MARKET_RESEARCHER.system_prompt,
-        timeout_seconds=MARKET_RESEARCHER.timeout_seconds,
-    )
 
-    if result.success and result.raw_output:
-        parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
-        if parsed:
-            result.output = parsed
-        else:
-            result.success = False
-            result.error = "JSON parse failed: could not extract structured output"
+async def run_market_researcher(
+    startup_name: str,
+    startup_description: str
+) -> AgentResult:
+    """
+    Research market size only.
+    ONE task: Find TAM/SAM/SOM and growth rate.
+    """
+    prompt = PROMPT_TEMPLATE.format_map({"name": startup_name, "desc": startup_description})
+
+    async def execute() -> AgentResult:
+        result = await run_agent(
+            agent_name=MARKET_RESEARCHER.name,
+            prompt=prompt,
+            tools=MARKET_RESEARCHER.tools,
+            model=MARKET_RESEARCHER.model,
+            system_prompt=MARKET_RESEARCHER.system_prompt,
+            timeout_seconds=MARKET_RESEARCHER.timeout_seconds,
+            max_tool_iterations=MARKET_RESEARCHER.max_tool_iterations,
+        )
+
+        if result.success and result.raw_output:
+            parsed = parse_json_from_output(result.raw_output, agent_name=result.agent_name)
+            if parsed:
+                result.output = parsed
+            else:
+                result.success = False
+                result.error = "JSON parse failed: could not extract structured output"
 
-    return result
\ No newline at end of file
+        return validate_output_keys(result, MARKET_RESEARCHER.output_keys)
+
+    # Market data is a property of the vertical, not the startup: when the
+    # description classifies into a known sector, cache at sector scope
+    # (longer TTL — markets move slower than companies) so peers in the
+    # same vertical share the result. Unclassified descriptions keep
+    # per-startup keys and can never collide.
+    sector = market_key(startup_description)
+    scope = sector or f"{startup_name}|{startup_description}"
+    key = hashlib.sha1(
+        f"{MARKET_RESEARCHER.name}|{source_version(__file__)}|{scope}".encode()
+    ).hexdigest()
+    return await agent_result_cache.get_or_compute(
+        key, ttl=7 * 86400 if sector else 3600,
+        factory=execute, cache_if=lambda r: r.success
+    )
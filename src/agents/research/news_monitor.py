@@ -1,13 +1,10 @@
-from ..base import run_agent, AgentResult, parse_json_from_output
+from typing import List
+
+from ..base import run_agent, AgentResult, parse_json_from_output, split_batch_results, validate_output_keys
 from ...config.agent_configs import NEWS_MONITOR
 
 
-async def run_news_monitor(startup_name: str) -> AgentResult:
-    """
-    Find recent news only.
-    ONE task: Get latest funding/product news.
-    """
-    prompt = f"""Find recent news about {startup_name}.
+PROMPT_TEMPLATE = """Find recent news about {name}.
 
 YOUR TASK: Find 3-5 recent news items. Use 1-2 web searches maximum.
 
@@ -21,6 +18,14 @@ Return JSON:
 }}
 """
 
+
+async def run_news_monitor(startup_name: str) -> AgentResult:
+    """
+    Find recent news only.
+    ONE task: Get latest funding/product news.
+    """
+    prompt = PROMPT_TEMPLATE.format_map({"name": startup_name})
+
     result = await run_agent(
         agent_name=NEWS_MONITOR.name,
         prompt=prompt,
@@ -28,6 +33,7 @@ Return JSON:
         model=NEWS_MONITOR.model,
         system_prompt=NEWS_MONITOR.system_prompt,
         timeout_seconds=NEWS_MONITOR.timeout_seconds,
+        max_tool_iterations=NEWS_MONITOR.max_tool_iterations,
     )
 
     if result.success and result.raw_output:
@@ -38,4 +44,55 @@ Return JSON:
             result.success = False
             result.error = "JSON parse failed: could not extract structured output"
 
-    return result
\ No newline at end of file
+    return validate_output_keys(result, NEWS_MONITOR.output_keys)
+
+# Beyond ~16 items per call, quality and latency wins both flatten out
+_BATCH_LIMIT = 16
+
+BATCH_PROMPT_TEMPLATE = """Find recent news about each startup below.
+
+YOUR TASK: For each startup, find 3-5 recent news items. Use 1-2 web searches per startup maximum.
+
+Startups:
+{startups}
+
+Return a JSON array with one object per startup, in the same order:
+[
+    {{
+        "startup": "startup name",
+        "recent_news": [
+            {{"date": "2024-01", "headline": "...", "type": "funding/product/partnership"}}
+        ],
+        "latest_funding": {{"amount": "$100M", "round": "Series D", "date": "2024"}},
+        "sentiment": "positive/neutral/negative"
+    }}
+]
+"""
+
+
+async def run_news_monitor_batch(startup_names: List[str]) -> List[AgentResult]:
+    """
+    Find recent news for many startups, one LLM call per 16.
+
+    Batching amortizes per-request network and queuing overhead across the
+    whole list; results come back as one AgentResult per startup, in order.
+    """
+    results: List[AgentResult] = []
+    for i in range(0, len(startup_names), _BATCH_LIMIT):
+        chunk = startup_names[i:i + _BATCH_LIMIT]
+        numbered = "\n".join(f"{j + 1}) {name}" for j, name in enumerate(chunk))
+        batch = await run_agent(
+            agent_name=NEWS_MONITOR.name,
+            prompt=BATCH_PROMPT_TEMPLATE.format_map({"startups": numbered}),
+            tools=NEWS_MONITOR.tools,
+            model=NEWS_MONITOR.model,
+            system_prompt=NEWS_MONITOR.system_prompt,
+            timeout_seconds=NEWS_MONITOR.timeout_seconds * len(chunk),
+            max_tool_iterations=NEWS_MONITOR.max_tool_iterations * len(chunk),
+            early_stop_on_json=False,  # array output: the first {} is not the whole answer
+        )
+        results.extend(
+            validate_output_keys(item, NEWS_MONITOR.output_keys)
+            for item in split_batch_results(batch, len(chunk), NEWS_MONITOR.name)
+        )
+    return results
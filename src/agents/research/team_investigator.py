@@ -1,13 +1,10 @@
-from ..base import run_agent, AgentResult, parse_json_from_output
+from typing import List
+
+from ..base import run_agent, AgentResult, parse_json_from_output, split_batch_results, validate_output_keys
 from ...config.agent_configs import TEAM_INVESTIGATOR
 
 
-async def run_team_investigator(startup_name: str) -> AgentResult:
-    """
-    Find founders and key executives only.
-    ONE task: Identify founding team and their backgrounds.
-    """
-    prompt = f"""Find the founding team of {startup_name}.
+PROMPT_TEMPLATE = """Find the founding team of {name}.
 
 YOUR TASK: Identify founders and CEO. Use 1-2 web searches maximum.
 
@@ -22,6 +19,14 @@ Return JSON:
 }}
 """
 
+
+async def run_team_investigator(startup_name: str) -> AgentResult:
+    """
+    Find founders and key executives only.
+    ONE task: Identify founding team and their backgrounds.
+    """
+    prompt = PROMPT_TEMPLATE.format_map({"name": startup_name})
+
     result = await run_agent(
         agent_name=TEAM_INVESTIGATOR.name,
         prompt=prompt,
@@ -29,6 +34,7 @@ Return JSON:
         model=TEAM_INVESTIGATOR.model,
         system_prompt=TEAM_INVESTIGATOR.system_prompt,
         timeout_seconds=TEAM_INVESTIGATOR.timeout_seconds,
+        max_tool_iterations=TEAM_INVESTIGATOR.max_tool_iterations,
     )
 
     if result.success and result.raw_output:
@@ -39,4 +45,56 @@ Return JSON:
             result.success = False
             result.error = "JSON parse failed: could not extract structured output"
 
-    return result
\ No newline at end of file
+    return validate_output_keys(result, TEAM_INVESTIGATOR.output_keys)
+
+# Beyond ~16 items per call, quality and latency wins both flatten out
+_BATCH_LIMIT = 16
+
+BATCH_PROMPT_TEMPLATE = """Find the founding team of each startup below.
+
+YOUR TASK: For each startup, identify founders and CEO. Use 1-2 web searches per startup maximum.
+
+Startups:
+{startups}
+
+Return a JSON array with one object per startup, in the same order:
+[
+    {{
+        "startup": "startup name",
+        "founders": [
+            {{"name": "John Doe", "role": "CEO", "background": "Previously at PayPal"}}
+        ],
+        "founding_year": 2010,
+        "key_executives": ["CFO name", "CTO name"],
+        "team_size_estimate": "1000-5000"
+    }}
+]
+"""
+
+
+async def run_team_investigator_batch(startup_names: List[str]) -> List[AgentResult]:
+    """
+    Investigate founding teams for many startups, one LLM call per 16.
+
+    Batching amortizes per-request network and queuing overhead across the
+    whole list; results come back as one AgentResult per startup, in order.
+    """
+    results: List[AgentResult] = []
+    for i in range(0, len(startup_names), _BATCH_LIMIT):
+        chunk = startup_names[i:i + _BATCH_LIMIT]
+        numbered = "\n".join(f"{j + 1}) {name}" for j, name in enumerate(chunk))
+        batch = await run_agent(
+            agent_name=TEAM_INVESTIGATOR.name,
+            prompt=BATCH_PROMPT_TEMPLATE.format_map({"startups": numbered}),
+            tools=TEAM_INVESTIGATOR.tools,
+            model=TEAM_INVESTIGATOR.model,
+            system_prompt=TEAM_INVESTIGATOR.system_prompt,
+            timeout_seconds=TEAM_INVESTIGATOR.timeout_seconds * len(chunk),
+            max_tool_iterations=TEAM_INVESTIGATOR.max_tool_iterations * len(chunk),
+            early_stop_on_json=False,  # array output: the first {} is not the whole answer
+        )
+        results.extend(
+            validate_output_keys(item, TEAM_INVESTIGATOR.output_keys)
+            for item in split_batch_results(batch, len(chunk), TEAM_INVESTIGATOR.name)
+        )
+    return results
@@ -1,7 +1,9 @@
 from .report_generator import run_report_generator
 from .decision_agent import run_decision_agent
+from .synthesis_agent import run_synthesis
 
 __all__ = [
     run_decision_agent,
-    run_report_generator
-]
\ No newline at end of file
+    run_report_generator,
+    run_synthesis,
+]
@@ -0,0 +1,115 @@
+"""Shared findings-context compiler for the synthesis agents."""
+
+import orjson
+from functools import lru_cache
+from typing import Any, Dict, List
+
+
+def compile_findings(
+    startup_name: str,
+    startup_description: str,
+    research_outputs: List[Dict[str, Any]],
+    analysis_outputs: List[Dict[str, Any]]
+) -> str:
+    """
+    Compile all findings into structured context.
+
+    Built as one generator-fed join instead of repeated list appends: each
+    append grows the list (and its string) incrementally, while a single
+    join lets CPython size the result once — cheap here, but this runs per
+    startup in batch mode, so per-call constant factors are multiplied.
+    """
+    return "\n".join((
+        f"# Startup: {startup_name}",
+        f"Description: {startup_description}\n",
+        "## RESEARCH FINDINGS\n",
+        *(_section(output) for output in research_outputs),
+        "## ANALYSIS FINDINGS\n",
+        *(_section(output) for output in analysis_outputs),
+    ))
+
+
+@lru_cache(maxsize=64)
+def _title(agent: str) -> str:
+    # Agent names come from a fixed set of ~11 configs, so the
+    # snake_case -> Title Case transform is memoized rather than redone
+    # for every section of every startup in a batch
+    return agent.replace('_', ' ').title()
+
+
+def _section(output: Dict[str, Any]) -> str:
+    """Render one agent's output as a `### Title` block."""
+    agent = output.get("agent", "Unknown")
+    data = output.get("output")
+    body = _compact(data) if output.get("success", False) and data else "*Data not available*"
+    return f"### {_title(agent)}\n{body}\n"
+
+
+def _compact(data: Any, budget: int = 1500) -> str:
+    """
+    Serialize one agent's output within a ~budget-character allowance.
+
+    Unlike a raw [:budget] slice, which can cut mid-key and leave invalid
+    JSON in the prompt, this drops empty values and truncates long strings
+    field-by-field first, so the budget is spent on structure rather than
+    one runaway field. The character budget approximates a token budget at
+    roughly four characters per token.
+    """
+    def prune(value):
+        if isinstance(value, dict):
+            return {
+                k: prune(v)
+                for k, v in value.items()
+                if v is not None and v != "" and v != [] and v != {}
+            }
+        if isinstance(value, list):
+            return [prune(v) for v in value[:20]]
+        if isinstance(value, str) and len(value) > 200:
+            return value[:200] + "..."
+        return value
+
+    text = orjson.dumps(prune(data), default=str).decode()
+    if len(text) <= budget:
+        return text
+    # Still oversized after pruning — fall back to the hard slice
+    return text[:budget]
+
+
+# Report section -> guidance blurb -> upstream agent that feeds it.
+# Sections with no upstream agent (None) always appear.
+_REPORT_SECTIONS = (
+    ("Executive Summary", "2-3 paragraph overview of the opportunity", None),
+    ("Company Overview", "Profile, products, funding history", None),
+    ("Market Opportunity", "TAM/SAM/SOM, growth trends, timing", "market_researcher"),
+    ("Competitive Landscape", "Competitors, positioning, advantages", "competitor_scout"),
+    ("Team Assessment", "Founders, executives, expertise", "team_investigator"),
+    ("Financial Analysis", "Funding, runway, revenue model", "financial_analyst"),
+    ("Technical Evaluation", "Tech stack, moat, patents", "tech_evaluator"),
+    ("Risk Assessment", "Top risks with severity and mitigation", "risk_assessor"),
+    ("Conclusion", "Summary of key findings", None),
+)
+
+
+def report_sections(
+    research_outputs: List[Dict[str, Any]],
+    analysis_outputs: List[Dict[str, Any]]
+) -> str:
+    """
+    Render the report's section list, skipping sections whose upstream
+    agent produced nothing.
+
+    Asking the model to write "Financial Analysis" when the financial
+    analyst failed just buys a paragraph of hedging — output tokens are
+    the slow, billed part of generation, so sections without data are
+    dropped from the request entirely.
+    """
+    succeeded = {
+        output.get("agent")
+        for output in (*research_outputs, *analysis_outputs)
+        if output.get("success") and output.get("output")
+    }
+    return "\n".join(
+        f"## {title}\n{blurb}\n"
+        for title, blurb, agent in _REPORT_SECTIONS
+        if agent is None or agent in succeeded
+    )
@@ -1,32 +1,47 @@
 """Decision Agent - makes final investment recommendation using Opus."""
 
-import json
+import orjson
 from typing import Optional, Dict, Any, List
 from ..base import run_agent, AgentResult, parse_json_from_output
 from ...config.agent_configs import DECISION_AGENT
 
 
-async def run_decision_agent(
-    startup_name: str,
-    full_report: str,
-    risk_assessment: Optional[Dict[str, Any]] = None,
-    research_outputs: Optional[List[Dict[str, Any]]] = None,
-    analysis_outputs: Optional[List[Dict[str, Any]]] = None
-) -> AgentResult:
-    """Make final investment recommendation."""
-    # Build context
-    context_parts = []
-    context_parts.append(f"# Investment Decision: {startup_name}\n")
-    context_parts.append("## Due Diligence Report\n")
-    context_parts.append(full_report)
+# Fast-path thresholds: a risk counts as critical when both its severity
+# and likelihood (each 1-10 from the risk assessor) clear these bars
+_CRITICAL_SEVERITY = 8
+_CRITICAL_LIKELIHOOD = 6
+_CRITICAL_COUNT_FOR_PASS = 2
 
-    if risk_assessment:
-        context_parts.append("\n## Risk Assessment Summary\n")
-        context_parts.append(json.dumps(risk_assessment, indent=2, default=str))
+_RISK_LIST_KEYS = (
+    "market_risks",
+    "competitive_risks",
+    "execution_risks",
+    "financial_risks",
+    "regulatory_risks",
+)
 
-    context = "\n".join(context_parts)
 
-    prompt = f"""As a senior investment decision maker, provide your recommendation:
+def _critical_risks(risk_assessment: Dict[str, Any]) -> List[str]:
+    """Collect descriptions of risks that clear the critical thresholds."""
+    critical = []
+    for key in _RISK_LIST_KEYS:
+        risks = risk_assessment.get(key)
+        if not isinstance(risks, list):
+            continue
+        for risk in risks:
+            if not isinstance(risk, dict):
+                continue
+            try:
+                severity = float(risk.get("severity", 0))
+                likelihood = float(risk.get("likelihood", 0))
+            except (TypeError, ValueError):
+                continue
+            if severity >= _CRITICAL_SEVERITY and likelihood >= _CRITICAL_LIKELIHOOD:
+                critical.append(risk.get("description") or f"Critical {key[:-1]}")
+    return critical
+
+
+PROMPT_TEMPLATE = """As a senior investment decision maker, provide your recommendation:
 
 {context}
 
@@ -58,6 +73,56 @@ Format as JSON:
 Be balanced and objective.
 """
 
+
+async def run_decision_agent(
+    startup_name: str,
+    full_report: str,
+    risk_assessment: Optional[Dict[str, Any]] = None,
+    research_outputs: Optional[List[Dict[str, Any]]] = None,
+    analysis_outputs: Optional[List[Dict[str, Any]]] = None
+) -> AgentResult:
+    """Make final investment recommendation."""
+    # Rules-based fast path: when the risk assessment already contains
+    # multiple critical red flags, the Opus call only ever restates them —
+    # emit the deterministic strong_pass locally and skip seconds of
+    # latency plus an expensive completion
+    if risk_assessment:
+        critical = _critical_risks(risk_assessment)
+        if len(critical) >= _CRITICAL_COUNT_FOR_PASS:
+            return AgentResult(
+                success=True,
+                output={
+                    "recommendation": "strong_pass",
+                    "confidence": 0.9,
+                    "key_factors_for": [],
+                    "key_factors_against": critical,
+                    "conditions": [],
+                    "summary_rationale": (
+                        f"Auto-declined: {len(critical)} critical risks "
+                        "(severity >= 8, likelihood >= 6) identified in the "
+                        "risk assessment."
+                    ),
+                },
+                agent_name=DECISION_AGENT.name,
+                execution_time_ms=0,
+            )
+
+    # Build context
+    context_parts = []
+    context_parts.append(f"# Investment Decision: {startup_name}\n")
+    context_parts.append("## Due Diligence Report\n")
+    context_parts.append(full_report)
+
+    if risk_assessment:
+        context_parts.append("\n## Risk Assessment Summary\n")
+        # Compact on purpose: the model tokenizes indentation whitespace,
+        # so pretty-printing inflates Opus input tokens for no benefit
+        context_parts.append(orjson.dumps(risk_assessment, default=str).decode())
+
+    context = "\n".join(context_parts)
+
+    prompt = PROMPT_TEMPLATE.format_map({"context": context})
+
     result = await run_agent(
         agent_name=DECISION_AGENT.name,
         prompt=prompt,
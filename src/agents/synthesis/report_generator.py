@@ -1,69 +1,65 @@
-import json
-from typing import Dict, Any, List
-from ..base import run_agent, AgentResult
+from typing import AsyncIterator, Dict, Any, List, Optional
+from ..base import run_agent, run_agent_streaming, AgentResult
 from ...config.agent_configs import REPORT_GENERATOR
+from ._context import compile_findings, report_sections
 
+# Kept as the historical name for existing importers
+_compile_findings = compile_findings
 
-async def run_report_generator(
-    startup_name: str,
-    startup_description: str,
-    research_outputs: List[Dict[str, Any]],
-    analysis_outputs: List[Dict[str, Any]]
-) -> AgentResult:
 
-    # Compile all findings into context
-    context = _compile_findings(
-        startup_name, 
-        startup_description,
-        research_outputs, 
-        analysis_outputs
-    )
-
-    prompt = f"""Generate a comprehensive due diligence report:
+PROMPT_TEMPLATE = """Generate a comprehensive due diligence report:
 
 {context}
 
 Create a professional Markdown report with these sections:
 
-# Report: {startup_name}
-
-## Executive Summary
-2-3 paragraph overview of the opportunity
+# Report: {name}
 
-## Company Overview
-Profile, products, funding history
-
-## Market Opportunity
-TAM/SAM/SOM, growth trends, timing
-
-## Competitive Landscape
-Competitors, positioning, advantages
-
-## Team Assessment
-Founders, executives, expertise
+{sections}
+Make the report professional and data-driven.
+"""
 
-## Financial Analysis
-Funding, runway, revenue model
 
-## Technical Evaluation
-Tech stack, moat, patents
+def _build_prompt(
+    startup_name: str,
+    context: str,
+    research_outputs: List[Dict[str, Any]],
+    analysis_outputs: List[Dict[str, Any]]
+) -> str:
+    # The section list is specialized per run: sections whose upstream
+    # agent failed are omitted rather than generated as filler
+    return PROMPT_TEMPLATE.format_map({
+        "name": startup_name,
+        "context": context,
+        "sections": report_sections(research_outputs, analysis_outputs),
+    })
 
-## Risk Assessment
-Top risks with severity and mitigation
 
-## Conclusion
-Summary of key findings
+async def run_report_generator(
+    startup_name: str,
+    startup_description: str,
+    research_outputs: List[Dict[str, Any]],
+    analysis_outputs: List[Dict[str, Any]],
+    compiled_context: Optional[str] = None
+) -> AgentResult:
 
-Make the report professional and data-driven.
-"""
+    # Reuse the caller's compiled context when it already built one —
+    # recompiling reserializes tens of KB of findings for nothing
+    context = compiled_context or compile_findings(
+        startup_name,
+        startup_description,
+        research_outputs,
+        analysis_outputs
+    )
 
     result = await run_agent(
         agent_name=REPORT_GENERATOR.name,
-        prompt=prompt,
+        prompt=_build_prompt(startup_name, context, research_outputs, analysis_outputs),
         tools=REPORT_GENERATOR.tools,
         model=REPORT_GENERATOR.model,
         system_prompt=REPORT_GENERATOR.system_prompt,
-        timeout_seconds=REPORT_GENERATOR.timeout_seconds
+        timeout_seconds=REPORT_GENERATOR.timeout_seconds,
+        early_stop_on_json=False,  # the report is Markdown, not JSON
     )
 
     # For report generator, output IS the raw text
@@ -72,39 +68,32 @@ Make the report professional and data-driven.
 
     return result
 
-def _compile_findings(
+
+def run_report_generator_streaming(
     startup_name: str,
     startup_description: str,
     research_outputs: List[Dict[str, Any]],
-    analysis_outputs: List[Dict[str, Any]]
-) -> str:
-    """Compile all findings into structured context."""
-    sections = []
-    sections.append(f"# Startup: {startup_name}")
-    sections.append(f"Description: {startup_description}\n")
-
-    sections.append("## RESEARCH FINDINGS\n")
-    for output in research_outputs:
-        agent = output.get("agent", "Unknown")
-        success = output.get("success", False)
-        data = output.get("output")
-        sections.append(f"### {agent.replace('_', ' ').title()}")
-        if success and data:
-            sections.append(json.dumps(data, indent=2, default=str)[:1500])
-        else:
-            sections.append("*Data not available*")
-        sections.append("")
-
-    sections.append("## ANALYSIS FINDINGS\n")
-    for output in analysis_outputs:
-        agent = output.get("agent", "Unknown")
-        success = output.get("success", False)
-        data = output.get("output")
-        sections.append(f"### {agent.replace('_', ' ').title()}")
-        if success and data:
-            sections.append(json.dumps(data, indent=2, default=str)[:1500])
-        else:
-            sections.append("*Data not available*")
-        sections.append("")
-
-    return "\n".join(sections)
\ No newline at end of file
+    analysis_outputs: List[Dict[str, Any]],
+    compiled_context: Optional[str] = None
+) -> AsyncIterator[str]:
+    """
+    Stream the report as Markdown chunks while it is being generated.
+
+    Lets callers render a preview (or hand sections to a downstream stage)
+    as soon as text arrives instead of waiting out the full completion.
+    """
+    context = compiled_context or compile_findings(
+        startup_name,
+        startup_description,
+        research_outputs,
+        analysis_outputs
+    )
+
+    return run_agent_streaming(
+        agent_name=REPORT_GENERATOR.name,
+        prompt=_build_prompt(startup_name, context, research_outputs, analysis_outputs),
+        tools=REPORT_GENERATOR.tools,
+        model=REPORT_GENERATOR.model,
+        system_prompt=REPORT_GENERATOR.system_prompt,
+        timeout_seconds=REPORT_GENERATOR.timeout_seconds,
+    )
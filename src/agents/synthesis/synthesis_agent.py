@@ -0,0 +1,152 @@
+"""Fused Synthesis Agent - report and decision in a single Opus call."""
+
+import re
+from typing import Any, Dict, List, Optional
+
+from ..base import run_agent, AgentResult, parse_json_from_output
+from ...config.agent_configs import SYNTHESIS_AGENT
+from ._context import compile_findings, report_sections
+from .decision_agent import _critical_risks, _CRITICAL_COUNT_FOR_PASS
+
+# The old pipeline ran Sonnet for the report, then re-uploaded the same
+# findings plus the report to Opus for the decision — two sequential
+# large-context calls paying ingest for the same material twice. One call
+# emitting both tagged sections halves the round trips and the upload.
+
+_REPORT_RE = re.compile(r'<REPORT>([\s\S]*?)</REPORT>')
+_DECISION_RE = re.compile(r'<DECISION>([\s\S]*?)</DECISION>')
+
+PROMPT_TEMPLATE = """Generate a due diligence report and investment decision:
+
+{context}
+
+Respond with EXACTLY two tagged sections.
+
+First, a professional Markdown report:
+
+<REPORT>
+# Report: {name}
+
+{sections}
+</REPORT>
+
+Then the investment decision as JSON. Recommendation options:
+- strong_invest: Compelling, priority investment
+- invest: Good opportunity, standard terms
+- hold: Interesting but wait for more traction
+- pass: Does not meet criteria
+- strong_pass: Significant concerns, avoid
+
+<DECISION>
+{{
+    "recommendation": "invest",
+    "confidence": 0.75,
+    "key_factors_for": ["Large market", "Strong team"],
+    "key_factors_against": ["High burn rate"],
+    "conditions": ["Want to see 3 more months of data"],
+    "summary_rationale": "Compelling opportunity despite concerns..."
+}}
+</DECISION>
+
+Make the report professional and data-driven. Be balanced and objective in the decision.
+"""
+
+
+async def run_synthesis(
+    startup_name: str,
+    startup_description: str,
+    research_outputs: List[Dict[str, Any]],
+    analysis_outputs: List[Dict[str, Any]],
+    compiled_context: Optional[str] = None
+) -> AgentResult:
+    """
+    Generate the report and the investment decision in one LLM call.
+
+    On success, result.output is {"full_report": str | None,
+    "investment_decision": dict | None} parsed from the tagged sections.
+    Pass compiled_context to reuse an already-built findings context.
+    """
+    # Rules-based fast path, same thresholds as the standalone decision
+    # agent: enough critical red flags in the risk assessment and Opus
+    # would only restate them — emit the deterministic strong_pass and a
+    # minimal report locally, skipping the call entirely
+    risk_assessment = next(
+        (o.get("output") for o in analysis_outputs
+         if o.get("agent") == "risk_assessor" and o.get("success") and o.get("output")),
+        None,
+    )
+    if risk_assessment:
+        critical = _critical_risks(risk_assessment)
+        if len(critical) >= _CRITICAL_COUNT_FOR_PASS:
+            risk_lines = "\n".join(f"- {risk}" for risk in critical)
+            return AgentResult(
+                success=True,
+                output={
+                    "full_report": (
+                        f"# Report: {startup_name}\n\n"
+                        "## Investment Decision\n\n"
+                        f"Auto-declined: {len(critical)} critical risks "
+                        "identified in the risk assessment.\n\n"
+                        f"## Critical Risks\n\n{risk_lines}\n"
+                    ),
+                    "investment_decision": {
+                        "recommendation": "strong_pass",
+                        "confidence": 0.9,
+                        "key_factors_for": [],
+                        "key_factors_against": critical,
+                        "conditions": [],
+                        "summary_rationale": (
+                            f"Auto-declined: {len(critical)} critical risks "
+                            "(severity >= 8, likelihood >= 6) identified in "
+                            "the risk assessment."
+                        ),
+                    },
+                },
+                agent_name=SYNTHESIS_AGENT.name,
+                execution_time_ms=0,
+            )
+
+    context = compiled_context or compile_findings(
+        startup_name,
+        startup_description,
+        research_outputs,
+        analysis_outputs
+    )
+
+    prompt = PROMPT_TEMPLATE.format_map({
+        "context": context,
+        "name": startup_name,
+        # Only ask for sections whose upstream agent produced data —
+        # missing-data sections would be generated as pure filler
+        "sections": report_sections(research_outputs, analysis_outputs),
+    })
+
+    result = await run_agent(
+        agent_name=SYNTHESIS_AGENT.name,
+        prompt=prompt,
+        tools=SYNTHESIS_AGENT.tools,
+        model=SYNTHESIS_AGENT.model,
+        system_prompt=SYNTHESIS_AGENT.system_prompt,
+        timeout_seconds=SYNTHESIS_AGENT.timeout_seconds,
+        early_stop_on_json=False,  # the report precedes the decision JSON
+    )
+
+    if result.success and result.raw_output:
+        report_match = _REPORT_RE.search(result.raw_output)
+        decision = None
+        decision_match = _DECISION_RE.search(result.raw_output)
+        if decision_match:
+            decision = parse_json_from_output(
+                decision_match.group(1), agent_name=result.agent_name
+            )
+
+        if report_match or decision:
+            result.output = {
+                "full_report": report_match.group(1).strip() if report_match else None,
+                "investment_decision": decision,
+            }
+        else:
+            result.success = False
+            result.error = "Synthesis parse failed: no <REPORT> or <DECISION> section found"
+
+    return result
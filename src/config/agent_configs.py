@@ -1,13 +1,23 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 
-@dataclass
+# frozen: configs are shared module-level constants read from every
+# agent call; slots: attribute reads skip the instance dict
+@dataclass(slots=True, frozen=True)
 class AgentConfig:
     name: str
     model: str
     tools: List[str]
     timeout_seconds: int
     system_prompt: str
+    # Hard cap on tool invocations per run (0 = unlimited). Prompts ask for
+    # "1-2 web searches maximum" but the model can ignore that; each extra
+    # tool round trip costs seconds, so the cap bounds worst-case latency.
+    max_tool_iterations: int = 0
+    # Required top-level keys in the agent's parsed JSON output. The CLI
+    # SDK cannot enforce a response schema server-side, so wrappers
+    # validate these after parsing and fail fast on structural drift.
+    output_keys: List[str] = field(default_factory=list)
 
 # =============================================================================
 # LAYER 1: RESEARCH AGENTS (5 agents)
@@ -19,7 +29,9 @@ COMPANY_PROFILER = AgentConfig(
     tools=["WebSearch", "WebFetch"],
     timeout_seconds=180,
     system_prompt="""You are a company research specialist. Research companies thoroughly and return structured data about their business, founding, and operations."""
-)
+,
+    max_tool_iterations=4,
+    output_keys=["name", "business_model"])
 
 MARKET_RESEARCHER = AgentConfig(
     name="market_researcher",
@@ -27,7 +39,9 @@ MARKET_RESEARCHER = AgentConfig(
     tools=["WebSearch", "WebFetch"],
     timeout_seconds=180,
     system_prompt="""You are a market research analyst. Analyze market opportunities, TAM/SAM/SOM, trends, and competitive landscape."""
-)
+,
+    max_tool_iterations=4,
+    output_keys=["target_market", "tam_billions"])
 
 COMPETITOR_SCOUT = AgentConfig(
     name="competitor_scout",
@@ -35,7 +49,9 @@ COMPETITOR_SCOUT = AgentConfig(
     tools=["WebSearch", "WebFetch"],
     timeout_seconds=180,
     system_prompt="""You are a competitive intelligence specialist. Identify and analyze competitors, their strengths, weaknesses, and market positioning."""
-)
+,
+    max_tool_iterations=4,
+    output_keys=["competitors"])
 
 TEAM_INVESTIGATOR = AgentConfig(
     name="team_investigator",
@@ -43,7 +59,9 @@ TEAM_INVESTIGATOR = AgentConfig(
     tools=["WebSearch", "WebFetch"],
     timeout_seconds=180,
     system_prompt="""You are a team research specialist. Research founders and key team members, their backgrounds, experience, and track records."""
-)
+,
+    max_tool_iterations=4,
+    output_keys=["founders"])
 
 NEWS_MONITOR = AgentConfig(
     name="news_monitor",
@@ -51,7 +69,9 @@ NEWS_MONITOR = AgentConfig(
     tools=["WebSearch", "WebFetch"],
     timeout_seconds=180,
     system_prompt="""You are a news analyst. Find recent news, press releases, and media coverage about companies."""
-)
+,
+    max_tool_iterations=4,
+    output_keys=["recent_news", "sentiment"])
 
 # =============================================================================
 # LAYER 2: ANALYSIS AGENTS (4 agents)
@@ -109,6 +129,16 @@ DECISION_AGENT = AgentConfig(
     system_prompt="""You are an investment decision advisor. Synthesize all available information to provide investment recommendations with confidence levels and key factors."""
 )
 
+# Fused report + decision in one call: the two-step pipeline uploaded the
+# same synthesis context twice (once to Sonnet, once to Opus)
+SYNTHESIS_AGENT = AgentConfig(
+    name="synthesis",
+    model="opus",
+    tools=[],
+    timeout_seconds=240,
+    system_prompt="""You are a senior investment analyst. Write comprehensive due diligence reports and provide investment recommendations with confidence levels and key factors."""
+)
+
 # =============================================================================
 # AGENT GROUPS
 # =============================================================================
@@ -131,6 +161,7 @@ ANALYSIS_AGENTS = [
 SYNTHESIS_AGENTS = [
     REPORT_GENERATOR,
     DECISION_AGENT,
+    SYNTHESIS_AGENT,
 ]
 
 ALL_AGENTS = RESEARCH_AGENTS + ANALYSIS_AGENTS + SYNTHESIS_AGENTS
\ No newline at end of file
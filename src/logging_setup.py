@@ -0,0 +1,40 @@
+"""Non-blocking logging for the async workflow processes.
+
+A plain StreamHandler writes to stdout/stderr synchronously under the
+logging lock — on some deployments (journald, piped output) that write
+can block, and inside an event loop every coroutine on the thread stalls
+with it. Routing records through a QueueHandler hands formatting and I/O
+to a background QueueListener thread, so emitting a log line is just an
+enqueue from the caller's point of view.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from typing import Optional
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def enable_nonblocking_logging(level: int = logging.INFO) -> None:
+    """Swap the root logger's handlers for a queue-backed pipeline.
+
+    Idempotent; existing handlers keep doing the actual writing, they
+    just do it on the listener thread instead of the caller's.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    root = logging.getLogger()
+    handlers = list(root.handlers) or [logging.StreamHandler()]
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+    _listener.start()
+    atexit.register(_listener.stop)
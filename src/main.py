@@ -86,7 +86,7 @@ async def main():
     # Run the workflow
     result = await run_due_diligence(
         startup_name=startup_name,
-        startup_descrption=startup_description.strip(),
+        startup_description=startup_description.strip(),
         funding_stage="Growth"
     )
 
@@ -1,30 +1,74 @@
-from typing import Optional
+from typing import List, Optional
 import asyncio
 import os
+import zlib
+import orjson
+from datetime import datetime
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from redis import Redis, RedisError
-from rq import Queue
+from redis import asyncio as aioredis
+from rq import Queue, get_current_job
 from rq.job import Job, NoSuchJobError
 from rq.exceptions import InvalidJobOperation
+from rq.command import send_stop_job_command
 import logging
 
-# Configure logging
+# Configure logging; handlers run on a background thread so log I/O
+# never stalls the event loop
 logging.basicConfig(level=logging.INFO)
+from .logging_setup import enable_nonblocking_logging
+enable_nonblocking_logging()
 logger = logging.getLogger(__name__)
 
+# The API process is pure I/O (Redis + client sockets), so uvloop's
+# libuv-based event loop is a drop-in latency win over default asyncio.
+# Installed before FastAPI/uvicorn create the loop; absent on platforms
+# uvloop doesn't support (e.g. Windows), the default loop is fine.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configuration from environment variables (12-factor app)
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
 REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
 REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', None)
 JOB_TIMEOUT = int(os.getenv('JOB_TIMEOUT', 600))  # 10 minutes default
 
+# Async Redis client for the request-handling path. The sync client
+# below blocks the event loop for a full round-trip per command; reads
+# in async endpoints go through this pooled client instead. RQ's API is
+# synchronous, so enqueue/cancel keep using the sync connection.
+aredis_pool = aioredis.ConnectionPool(
+    host=REDIS_HOST,
+    port=REDIS_PORT,
+    password=REDIS_PASSWORD,
+    max_connections=64,
+    # Named connections make CLIENT LIST attribute traffic to this
+    # process when profiling which paths deserve pipelining
+    client_name=f'api-async:{os.getpid()}',
+)
+aredis = aioredis.Redis(connection_pool=aredis_pool)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await aredis.aclose()
+    await aredis_pool.disconnect()
+
+
 # Set up FastAPI with metadata
 app = FastAPI(
     title="Due Diligence API",
     description="Async multi-agent due diligence analysis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS middleware for production (configure allowed origins)
@@ -48,12 +92,31 @@ try:
         retry_on_timeout=True
     )
     redis_conn.ping()  # Test connection
+    redis_conn.client_setname(f'api:{os.getpid()}')  # attribution in CLIENT LIST
     logger.info(f"Connected to Redis at {REDIS_HOST}:{REDIS_PORT}")
 except RedisError as e:
     logger.error(f"Failed to connect to Redis: {e}")
     raise
 
-agent_tasks = Queue('agents', connection=redis_conn)
+class ORJSONSerializer:
+    """RQ serializer protocol (dumps/loads) backed by orjson.
+
+    Job payloads here are plain str/dict/list — pickle's flexibility buys
+    nothing and costs bytes, CPU, and cross-language safety. JSON-encoded
+    jobs are smaller on the wire and in Redis RAM, and any consumer can
+    read them.
+    """
+
+    @staticmethod
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+
+agent_tasks = Queue('agents', connection=redis_conn, serializer=ORJSONSerializer)
 
 # Request/Response models
 class AnalysisRequest(BaseModel):
@@ -66,6 +129,16 @@ class AnalysisResponse(BaseModel):
     message: str
     job_id: str
 
+class BatchAnalysisRequest(BaseModel):
+    # Cap follows Redis's pipelining guidance: keep a single pipeline's
+    # buffered commands to a reasonable size
+    items: List[AnalysisRequest] = Field(..., min_length=1, max_length=10000)
+
+class BatchAnalysisResponse(BaseModel):
+    success: bool
+    message: str
+    job_ids: List[str]
+
 class JobStatusResponse(BaseModel):
     job_id: str
     status: str  # queued, started, finished, failed
@@ -87,11 +160,36 @@ def run_agent_pipeline(
     try:
         # Lazy import to prevent macOS fork issues
         from .workflow import run_due_diligence
-        
+        from .workflow.progress import set_progress_publisher
+
+        job = get_current_job()
+        if job is not None:
+            job_key = job.key
+            stream_key = f'rq:progress:{job.id}'
+
+            def _publish(stage: str, detail: dict) -> None:
+                # One pipeline per stage boundary: HSET feeds the status
+                # poller, XADD feeds streaming consumers, flushed together
+                payload = orjson.dumps({"stage": stage, **detail})
+                pipe = redis_conn.pipeline(transaction=False)
+                pipe.hset(job_key, 'progress', payload)
+                pipe.xadd(stream_key, {'data': payload}, maxlen=100, approximate=True)
+                pipe.expire(stream_key, 86400)
+                pipe.execute()
+
+            set_progress_publisher(_publish)
+
         logger.info(f"Starting due diligence for: {startup_name}")
-        result = asyncio.run(
-            run_due_diligence(startup_name, description, funding_stage)
-        )
+        try:
+            result = asyncio.run(
+                run_due_diligence(
+                    startup_name=startup_name,
+                    startup_description=description,
+                    funding_stage=funding_stage,
+                )
+            )
+        finally:
+            set_progress_publisher(None)
         logger.info(f"Completed due diligence for: {startup_name}")
         return result
     except Exception as e:
@@ -101,18 +199,23 @@ def run_agent_pipeline(
 
 # Health check
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint for load balancers/monitoring"""
     try:
-        redis_conn.ping()
+        # One async pipeline: ping + queue length without blocking the loop
+        pipe = aredis.pipeline(transaction=False)
+        pipe.ping()
+        pipe.llen(agent_tasks.key)
+        _, queue_size = await pipe.execute()
         redis_healthy = True
     except RedisError:
         redis_healthy = False
-    
+        queue_size = None
+
     return {
         "status": "healthy" if redis_healthy else "degraded",
         "redis": "connected" if redis_healthy else "disconnected",
-        "queue_size": len(agent_tasks) if redis_healthy else None
+        "queue_size": queue_size
     }
 
 
@@ -149,93 +252,234 @@ async def submit_analysis(request: AnalysisRequest):
         )
 
 
+# Submit many analysis jobs in one request
+@app.post("/analyze/batch", response_model=BatchAnalysisResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_analysis_batch(request: BatchAnalysisRequest):
+    """
+    Submit many due diligence jobs at once.
+
+    A per-item enqueue issues several Redis commands per job, so N items
+    cost O(N) round-trips. enqueue_many stages every job on one pipeline
+    and flushes it in a single round-trip.
+    """
+    try:
+        pipe = redis_conn.pipeline(transaction=False)
+        jobs = agent_tasks.enqueue_many(
+            [
+                Queue.prepare_data(
+                    run_agent_pipeline,
+                    args=(item.startup_name, item.startup_description, item.funding_stage),
+                    timeout=JOB_TIMEOUT,
+                    result_ttl=86400,
+                    failure_ttl=86400,
+                )
+                for item in request.items
+            ],
+            pipeline=pipe,
+        )
+        pipe.execute()
+
+        logger.info(f"Enqueued {len(jobs)} jobs in one batch")
+
+        return BatchAnalysisResponse(
+            success=True,
+            message=f"{len(jobs)} analysis jobs submitted. Check status at /analyze/status/{{job_id}}",
+            job_ids=[job.id for job in jobs]
+        )
+    except RedisError as e:
+        logger.error(f"Redis error while batch enqueuing: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Queue service temporarily unavailable"
+        )
+
+
+# rq:job:<id> key construction is pure string work but runs on every
+# poll of every endpoint; memoize per job id
+_job_key = lru_cache(maxsize=4096)(Job.key_for)
+
+
+def _decompress_exc(raw: Optional[bytes]) -> Optional[str]:
+    """Decode an exc payload that RQ may have zlib-compressed."""
+    if not raw:
+        return None
+    try:
+        raw = zlib.decompress(raw)
+    except zlib.error:
+        pass  # stored uncompressed
+    return raw.decode(errors='replace')
+
+
 # Check job status
 @app.get("/analyze/status/{job_id}", response_model=JobStatusResponse)
-def get_job_status(job_id: str):
+async def get_job_status(job_id: str, include_result: bool = True):
     """
     Check the status of a submitted analysis job.
     Returns job status, result (if complete), or error (if failed).
+
+    Clients poll this endpoint, so it is kept to a single pipelined
+    round-trip: the job hash and the latest result-stream entry come back
+    together, instead of Job.fetch + get_status + result each hitting
+    Redis separately. Pollers that only care about status can pass
+    include_result=0 to skip fetching and deserializing result payloads
+    (KBs per finished job) entirely.
     """
     try:
-        job = Job.fetch(job_id, connection=redis_conn)
-        
-        response = JobStatusResponse(
-            job_id=job_id,
-            status=job.get_status(),
-            result=None,
-            error=None
+        pipe = aredis.pipeline(transaction=False)
+        pipe.hgetall(_job_key(job_id))
+        if include_result:
+            pipe.xrevrange(f'rq:results:{job_id}', '+', '-', count=1)
+        replies = await pipe.execute()
+        raw = replies[0]
+        latest = replies[1] if include_result else None
+    except RedisError as e:
+        logger.error(f"Error fetching job {job_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Queue service temporarily unavailable"
         )
-        
-        # Add result if job finished successfully
-        if job.is_finished:
-            response.result = job.result
-        
-        # Add error if job failed
-        elif job.is_failed:
-            response.error = str(job.exc_info) if job.exc_info else "Job failed with unknown error"
-        
-        # Add progress info for running jobs
-        elif job.is_started:
-            response.progress = {
-                "started_at": job.started_at.isoformat() if job.started_at else None,
-                "message": "Analysis in progress..."
-            }
-        
-        return response
-        
-    except NoSuchJobError:
+
+    if not raw:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found. It may have expired (jobs expire after 24 hours)."
         )
-    except (RedisError, InvalidJobOperation) as e:
-        logger.error(f"Error fetching job {job_id}: {e}")
+
+    job_status = (raw.get(b'status') or b'').decode() or "unknown"
+    response = JobStatusResponse(job_id=job_id, status=job_status, result=None, error=None)
+    result_payload = dict(latest[0][1]) if latest else {}
+
+    # Add result if job finished successfully
+    if job_status == 'finished':
+        return_value = result_payload.get(b'return_value')
+        if return_value is not None:
+            response.result = agent_tasks.serializer.loads(return_value)
+
+    # Add error if job failed
+    elif job_status == 'failed':
+        response.error = (
+            _decompress_exc(result_payload.get(b'exc_string'))
+            or _decompress_exc(raw.get(b'exc_info'))
+            or "Job failed with unknown error"
+        )
+
+    # Add progress info for running jobs
+    elif job_status == 'started':
+        started_at = raw.get(b'started_at')
+        progress = raw.get(b'progress')
+        response.progress = {
+            "started_at": started_at.decode() if started_at else None,
+            # Stage-boundary detail written by the worker's progress pipeline
+            **(orjson.loads(progress) if progress else {"message": "Analysis in progress..."}),
+        }
+
+    return response
+
+
+# Redis-side diagnostics: which connections exist (named per process)
+# and which commands dominate server time — the data needed to decide
+# where the next pipeline is worth adding
+@app.get("/debug/redis")
+async def debug_redis():
+    """Connection list and per-command stats for profiling Redis usage"""
+    try:
+        pipe = aredis.pipeline(transaction=False)
+        pipe.client_list()
+        pipe.info('commandstats')
+        clients, commandstats = await pipe.execute()
+    except RedisError as e:
+        logger.error(f"Error reading Redis diagnostics: {e}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Queue service temporarily unavailable"
         )
 
+    return {
+        "clients": [
+            {"name": c.get("name") or "(unnamed)", "addr": c.get("addr"), "age": c.get("age")}
+            for c in clients
+        ],
+        "commandstats": commandstats,
+    }
+
 
 # Cancel a job (optional but useful)
 @app.delete("/analyze/{job_id}")
-def cancel_job(job_id: str):
+async def cancel_job(job_id: str):
     """Cancel a running or queued job"""
+    # The old path did Job.fetch (full HGETALL + unpickle) just to check
+    # is_finished — existence and status are one pipelined round-trip
+    pipe = aredis.pipeline(transaction=False)
+    pipe.exists(_job_key(job_id))
+    pipe.hget(_job_key(job_id), 'status')
+    exists, raw_status = await pipe.execute()
+
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+
+    job_status = (raw_status or b'').decode()
+    if job_status in ('finished', 'canceled'):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot cancel completed job"
+        )
+
     try:
-        job = Job.fetch(job_id, connection=redis_conn)
-        
-        if job.is_finished:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot cancel completed job"
-            )
-        
-        job.cancel()
-        logger.info(f"Cancelled job {job_id}")
-        
-        return {"success": True, "message": f"Job {job_id} cancelled"}
-        
+        if job_status == 'started':
+            # Tell the worker to kill the executing horse; no job load needed
+            send_stop_job_command(redis_conn, job_id)
+        else:
+            # Queued/deferred jobs need the full cancel dance (dequeue +
+            # registry moves), which requires the loaded job
+            Job.fetch(job_id, connection=redis_conn).cancel()
     except NoSuchJobError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Job {job_id} not found"
         )
+    except InvalidJobOperation as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    logger.info(f"Cancelled job {job_id}")
+    return {"success": True, "message": f"Job {job_id} cancelled"}
 
 
 # List recent jobs (useful for debugging/monitoring)
 @app.get("/analyze/jobs/recent")
-def list_recent_jobs(limit: int = 10):
+async def list_recent_jobs(limit: int = 10):
     """List recent jobs (for monitoring/debugging)"""
     try:
-        jobs = agent_tasks.jobs[:limit]
+        # The response only needs id/status/created_at, so don't load full
+        # job hashes at all — fetch_many pulls (and unpickles) the whole
+        # payload including the data blob. One pipeline of HMGETs reads
+        # exactly the two fields that get serialized.
+        raw_ids = await aredis.lrange(agent_tasks.key, 0, limit - 1)
+        job_ids = [job_id.decode() for job_id in raw_ids]
+
+        pipe = aredis.pipeline(transaction=False)
+        for job_id in job_ids:
+            pipe.hmget(_job_key(job_id), 'status', 'created_at')
+        pipe.llen(agent_tasks.key)
+        *rows, queue_length = await pipe.execute()
+
         return {
-            "queue_length": len(agent_tasks),
+            "queue_length": queue_length,
             "recent_jobs": [
                 {
-                    "job_id": job.id,
-                    "status": job.get_status(),
-                    "created_at": job.created_at.isoformat() if job.created_at else None,
+                    "job_id": job_id,
+                    "status": job_status.decode() if job_status else "unknown",
+                    "created_at": (
+                        datetime.fromisoformat(created.decode().rstrip('Z')).isoformat()
+                        if created else None
+                    ),
                 }
-                for job in jobs
+                for job_id, (job_status, created) in zip(job_ids, rows)
             ]
         }
     except RedisError as e:
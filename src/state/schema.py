@@ -1,5 +1,4 @@
 from typing import Annotated, Optional, List, Dict, Any, TypedDict
-from operator import add
 from .enums import StateField
 
 
@@ -8,14 +7,45 @@ def replace_list(old: List, new: List) -> List:
     return new
 
 
+# Ring-buffer bound on the errors list: checkpointers serialize the full
+# state at every node boundary, so an unbounded error log costs O(n) per
+# checkpoint forever. 64 distinct errors is far more than any run needs.
+_MAX_ERRORS = 64
+
+
+def dedup_append(old: List[str], new: List[str]) -> List[str]:
+    """Reducer that appends while dropping duplicates, preserving order.
+
+    The plain `add` reducer concatenates on every retry, so repeated
+    errors grew the list quadratically across retries. Dedup keeps one
+    copy of each message; the tail slice keeps only the most recent
+    _MAX_ERRORS of them, ring-buffer style.
+    """
+    return list(dict.fromkeys(old + new))[-_MAX_ERRORS:]
+
+
+def merge_by_agent(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Reducer that replaces entries by agent name instead of appending.
+
+    With `add`, a retried agent appeared twice (failed entry plus retried
+    entry) and downstream scans saw whichever came first. Keyed on
+    "agent", the latest result wins and state size stays bounded at one
+    entry per agent regardless of retry count.
+    """
+    merged = {entry["agent"]: entry for entry in old}
+    merged.update({entry["agent"]: entry for entry in new})
+    return list(merged.values())
+
+
 class DueDiligenceState(TypedDict):
     startup_name: str
     startup_description: str
     funding_stage: Optional[str]
 
-    # Agent outputs - stored as dicts, use add reducer to accumulate
-    research_outputs: Annotated[List[Dict[str, Any]], add]
-    analysis_outputs: Annotated[List[Dict[str, Any]], add]
+    # Agent outputs - one entry per agent, retries replace in place
+    research_outputs: Annotated[List[Dict[str, Any]], merge_by_agent]
+    research_success_count: int
+    analysis_outputs: Annotated[List[Dict[str, Any]], merge_by_agent]
 
     # Synthesis outputs
     full_report: Optional[str]
@@ -23,7 +53,7 @@ class DueDiligenceState(TypedDict):
 
     # Workflow tracking
     current_stage: str
-    errors: Annotated[List[str], add]
+    errors: Annotated[List[str], dedup_append]
     retry_count: int
 
     # Failed agents tracking - replaced each run, not accumulated
@@ -35,12 +65,25 @@ def create_initial_state(
     startup_description: str,
     funding_stage: Optional[str] = None
 ) -> DueDiligenceState:
-    """Create initial state with empty lists and sensible defaults."""
+    """Create initial state with empty lists and sensible defaults.
+
+    Inputs are type-checked here so a bad caller fails immediately with a
+    clear error, instead of surfacing later as a serializer surprise or a
+    defensive `.get(..., default)` deep inside a node.
+    """
+    if not isinstance(startup_name, str) or not startup_name:
+        raise TypeError(f"startup_name must be a non-empty str, got {startup_name!r}")
+    if not isinstance(startup_description, str) or not startup_description:
+        raise TypeError(f"startup_description must be a non-empty str, got {startup_description!r}")
+    if funding_stage is not None and not isinstance(funding_stage, str):
+        raise TypeError(f"funding_stage must be a str or None, got {funding_stage!r}")
+
     return DueDiligenceState(
         startup_name=startup_name,
         startup_description=startup_description,
         funding_stage=funding_stage,
         research_outputs=[],
+        research_success_count=0,
         analysis_outputs=[],
         full_report=None,
         investment_decision=None,
@@ -0,0 +1,44 @@
+"""RQ worker entry point that pre-warms the workflow before taking jobs.
+
+run_agent_pipeline lazy-imports the workflow to keep heavy dependencies
+out of the parent process before fork, which means a bare `rq worker`
+makes its first job pay the full LangGraph import + graph compile +
+tracing setup cost. Starting workers through this module instead forces
+that work once, post-fork, before the first job is picked up. The lazy
+import in run_agent_pipeline stays as a fallback for workers started the
+plain way.
+
+Usage: python -m src.worker
+"""
+
+import logging
+import os
+
+from rq import Worker
+
+from .logging_setup import enable_nonblocking_logging
+from .main_redis import ORJSONSerializer, agent_tasks, redis_conn
+
+logging.basicConfig(level=logging.INFO)
+enable_nonblocking_logging()
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    # Pre-warm: import the workflow stack and compile the graph now, so
+    # the first job is dominated by agent work rather than setup
+    logger.info("Pre-warming workflow (imports + graph compile)...")
+    from .workflow import get_compiled_graph
+    get_compiled_graph()
+    logger.info("Workflow pre-warmed, starting worker")
+
+    # Rename the inherited API connection so CLIENT LIST attributes this
+    # process's traffic to the worker, not the web tier
+    redis_conn.client_setname(f'rq-worker:{os.getpid()}')
+    worker = Worker(queues=[agent_tasks], connection=redis_conn,
+                    serializer=ORJSONSerializer)
+    worker.work(with_scheduler=False)
+
+
+if __name__ == "__main__":
+    main()
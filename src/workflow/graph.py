@@ -1,4 +1,8 @@
 from langgraph.graph import StateGraph, END
+from langgraph.types import CachePolicy
+from langgraph.cache.sqlite import SqliteCache
+import hashlib
+import orjson
 from ..state.schema import DueDiligenceState
 from .nodes import (
     init_node,
@@ -11,27 +15,82 @@ from .nodes import (
 from .routing import check_init_success, check_research_completeness
 from typing import Optional
 
+import asyncio
+import functools
 import os
+import threading
 from dotenv import load_dotenv
 from braintrust import init_logger
 from braintrust_langchain import BraintrustCallbackHandler, set_global_handler
 
 load_dotenv()
 
-def create_due_diligence_graph() -> StateGraph:
+_braintrust_lock = threading.Lock()
+_braintrust_inited = False
+
+
+def _init_braintrust() -> None:
+    """Register Braintrust tracing exactly once per process."""
+    global _braintrust_inited
+    if _braintrust_inited:
+        return
+    with _braintrust_lock:
+        if _braintrust_inited:
+            return
+        init_logger(project='multi-agent-system')
+        set_global_handler(BraintrustCallbackHandler())
+        _braintrust_inited = True
+
+
+# Node-level cache: repeat invocations for the same startup skip the
+# multi-second agent fan-out entirely and replay the stored node output.
+# Backed by sqlite so hits survive process restarts; set NODE_CACHE_DB=''
+# to disable. The per-agent TTL cache in agents/cache.py still handles
+# partial hits within a run; this layer short-circuits whole nodes.
+_NODE_CACHE_DB = os.getenv('NODE_CACHE_DB', 'node_cache.sqlite')
+_NODE_CACHE_TTL = int(os.getenv('NODE_CACHE_TTL', 86400))
+
+
+def _digest(*parts) -> str:
+    return hashlib.blake2b(
+        orjson.dumps(parts, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _research_cache_key(state: dict) -> str:
+    # failed_research_agents and retry_count keep retry passes distinct
+    # from the first pass — otherwise a retry would replay its own miss
+    return _digest(
+        state['startup_name'],
+        state['startup_description'],
+        state.get('failed_research_agents', []),
+        state.get('retry_count', 0),
+    )
+
+
+def _analysis_cache_key(state: dict) -> str:
+    # Keyed on the successful research payloads, not just startup
+    # identity, so refreshed research invalidates the cached analysis
+    return _digest(
+        state['startup_name'],
+        [o for o in state.get('research_outputs', []) if o.get('success')],
+    )
 
-    # brain trust logging trace of langraph
-    init_logger(project='multi-agent-system')
-    handler = BraintrustCallbackHandler()
-    set_global_handler(handler)
+
+def create_due_diligence_graph() -> StateGraph:
 
     workflow = StateGraph(DueDiligenceState)
 
     # Add nodes
     workflow.add_node("init", init_node)
-    workflow.add_node("research", research_node)
+    workflow.add_node("research", research_node,
+                      cache_policy=CachePolicy(key_func=_research_cache_key,
+                                               ttl=_NODE_CACHE_TTL))
     workflow.add_node("validate_research", validate_research_node)
-    workflow.add_node("analysis", analysis_node)
+    workflow.add_node("analysis", analysis_node,
+                      cache_policy=CachePolicy(key_func=_analysis_cache_key,
+                                               ttl=_NODE_CACHE_TTL))
     workflow.add_node("synthesis", synthesis_node)
     workflow.add_node("output", output_node)
 
@@ -64,28 +123,87 @@ def create_due_diligence_graph() -> StateGraph:
 
 def compile_workflow():
     graph = create_due_diligence_graph()
-    return graph.compile()
-
-compiled_graph = None
+    cache = SqliteCache(path=_NODE_CACHE_DB) if _NODE_CACHE_DB else None
+    return graph.compile(cache=cache)
 
+@functools.cache
 def get_compiled_graph():
-    global compiled_graph
-    if compiled_graph is None:
-        compiled_graph = compile_workflow()
-    return compiled_graph
+    # Compile (and register tracing handlers) once per worker process;
+    # every job after the first reuses the same compiled graph
+    _init_braintrust()
+    return compile_workflow()
+
+
+# Checkpointing: with a saver attached, LangGraph persists state at every
+# node return, so a crashed or preempted worker resumes a job with
+# research_outputs already populated instead of starting over. Off by
+# default (resume semantics are opt-in); point CHECKPOINT_DB at a sqlite
+# file to enable. Built lazily because AsyncSqliteSaver needs a running
+# event loop for its aiosqlite connection.
+_CHECKPOINT_DB = os.getenv('CHECKPOINT_DB', '')
+_checkpointed_graph = None
+_checkpoint_init_lock = None
+
+
+async def _get_checkpointed_graph():
+    global _checkpointed_graph, _checkpoint_init_lock
+    if _checkpointed_graph is not None:
+        return _checkpointed_graph
+    if _checkpoint_init_lock is None:
+        _checkpoint_init_lock = asyncio.Lock()
+    async with _checkpoint_init_lock:
+        if _checkpointed_graph is None:
+            import aiosqlite
+            from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+            conn = await aiosqlite.connect(_CHECKPOINT_DB)
+            saver = AsyncSqliteSaver(conn)
+            await saver.setup()
+            _init_braintrust()
+            _checkpointed_graph = create_due_diligence_graph().compile(
+                checkpointer=saver,
+                cache=SqliteCache(path=_NODE_CACHE_DB) if _NODE_CACHE_DB else None,
+            )
+    return _checkpointed_graph
 
 async def run_due_diligence(startup_name : str,
-                            startup_descrption: str,
-                            funding_stage : Optional[str]=None ) -> DueDiligenceState:
-    
+                            startup_description: str = None,
+                            funding_stage : Optional[str]=None,
+                            thread_id: Optional[str] = None,
+                            **kwargs) -> DueDiligenceState:
+
     from ..state.schema import create_initial_state
 
-    initial_state = create_initial_state(startup_name=startup_name, 
-                                         startup_description=startup_descrption,
+    # The parameter was misspelled "startup_descrption" for a while;
+    # keep accepting the old keyword so existing callers don't break
+    if startup_description is None and 'startup_descrption' in kwargs:
+        import warnings
+        warnings.warn(
+            "startup_descrption is deprecated; pass startup_description",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        startup_description = kwargs.pop('startup_descrption')
+    if kwargs:
+        raise TypeError(f"Unexpected keyword arguments: {sorted(kwargs)}")
+
+    initial_state = create_initial_state(startup_name=startup_name,
+                                         startup_description=startup_description,
                                          funding_stage=funding_stage)
 
-    graph = get_compiled_graph()
-    print(graph.get_graph().draw_ascii())
-
-    final_state = await graph.ainvoke(initial_state)
+    if _CHECKPOINT_DB:
+        graph = await _get_checkpointed_graph()
+        # Stable default thread id: re-submitting the same startup after a
+        # crash lands on the same thread, so the reducers merge the
+        # checkpointed outputs and only the unfinished agents re-run
+        config = {"configurable": {"thread_id": thread_id or _digest(
+            startup_name, startup_description)}}
+    else:
+        graph = get_compiled_graph()
+        config = None
+
+    # ASCII graph layout is pure per-job overhead; opt in for debugging
+    if os.getenv('DEBUG_GRAPH'):
+        print(graph.get_graph().draw_ascii())
+
+    final_state = await graph.ainvoke(initial_state, config)
     return final_state
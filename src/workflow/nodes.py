@@ -8,25 +8,45 @@ import time, asyncio
 
 logger = logging.getLogger('workflow.nodes')
 
+__all__ = [
+    "init_node",
+    "research_node",
+    "validate_research_node",
+    "analysis_node",
+    "synthesis_node",
+    "output_node",
+]
+
 from ..agents.research.company_profiler import run_company_profiler
 from ..agents.research.competitor_scout import run_competitor_scout
 from ..agents.research.market_researcher import run_market_researcher
 from ..agents.research.news_monitor import run_news_monitor
 from ..agents.research.team_investigator import run_team_investigator
 
-from ..agents.analysis.financial_analyst import run_financial_analyst
-from ..agents.analysis.legal_reviewer import run_legal_reviewer
+from ..agents.analysis import start_all_analysis
 from ..agents.analysis.risk_assessor import run_risk_assessor
-from ..agents.analysis.tech_evaluator import run_tech_evaluator
 
 
-from ..agents.synthesis.report_generator import run_report_generator
-from ..agents.synthesis.decision_agent import run_decision_agent
+from ..agents.synthesis.synthesis_agent import run_synthesis
+from .progress import publish_progress
+
+# Dispatch table built once at import instead of five fresh closures per
+# research_node call. Runners share a (name, description) signature; the
+# agents that only need the name ignore the second argument.
+AGENT_RUNNERS = {
+    "company_profiler": lambda name, desc: run_company_profiler(name, desc),
+    "market_researcher": lambda name, desc: run_market_researcher(name, desc),
+    "competitor_scout": lambda name, desc: run_competitor_scout(name, desc),
+    "team_investigator": lambda name, desc: run_team_investigator(name),
+    "news_monitor": lambda name, desc: run_news_monitor(name),
+}
+ALL_RESEARCH_AGENTS = tuple(AGENT_RUNNERS)
+
 
 async def init_node(state: DueDiligenceState) -> Dict[str, Any]:
     """Initialize the workflow."""
-    print("Running: init_node")
-    print(f"  Startup: {state.get('startup_name')}")
+    logger.info("Running: init_node")
+    logger.info("  Startup: %s", state.get('startup_name'))
     return {"current_stage": "init_complete"}
 
 async def research_node(state: DueDiligenceState) -> Dict[str, Any]:
@@ -38,54 +58,46 @@ async def research_node(state: DueDiligenceState) -> Dict[str, Any]:
     # Check if this is a retry - only run failed agents
     failed_agents = state.get('failed_research_agents', [])
     existing_outputs = state.get('research_outputs', [])
-
-    # Map agent names to their runner functions
-    agent_runners = {
-        "company_profiler": lambda: run_company_profiler(state['startup_name'], state['startup_description']),
-        "market_researcher": lambda: run_market_researcher(state['startup_name'], state['startup_description']),
-        "competitor_scout": lambda: run_competitor_scout(state['startup_name'], state['startup_description']),
-        "team_investigator": lambda: run_team_investigator(state['startup_name']),
-        "news_monitor": lambda: run_news_monitor(state['startup_name']),
-    }
-
-    all_agents = list(agent_runners.keys())
+    startup_name = state['startup_name']
+    startup_description = state['startup_description']
 
     # Determine which agents to run
     if failed_agents:
         agents_to_run = failed_agents
-        print("\n" + "=" * 60)
-        print(f"STAGE 2: RESEARCH (RETRY - {len(agents_to_run)} failed agents)")
-        print("=" * 60)
+        logger.info("STAGE 2: RESEARCH (RETRY - %d failed agents)", len(agents_to_run))
     else:
-        agents_to_run = all_agents
-        print("\n" + "=" * 60)
-        print(f"STAGE 2: RESEARCH ({len(agents_to_run)} agents, max 2 concurrent)")
-        print("=" * 60)
+        agents_to_run = ALL_RESEARCH_AGENTS
+        logger.info("STAGE 2: RESEARCH (%d agents, parallel)", len(agents_to_run))
 
     for name in agents_to_run:
-        print(f"  Queued: {name}")
+        logger.info("  Queued: %s", name)
 
     start_time = time.time()
 
-    # Semaphore limits concurrent execution to avoid rate limits
-    semaphore = asyncio.Semaphore(2)
-
-    async def run_with_limit(agent_name: str):
-        async with semaphore:
-            print(f"  RUNNING: {agent_name}")
-            return await agent_runners[agent_name]()
-
-    # Run only the agents we need
-    tasks = [run_with_limit(name) for name in agents_to_run]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Run only the agents we need, all at once — research latency is
+    # max() of the agents instead of a 2-at-a-time pipeline. Rate-limit
+    # backpressure lives in run_agent's shared semaphore now. Results are
+    # handled as each agent lands (as_completed) rather than after the
+    # whole gather, so progress goes out per completion instead of once
+    # the slowest agent finishes.
+    async def _run(name: str):
+        try:
+            return name, await AGENT_RUNNERS[name](startup_name, startup_description)
+        except Exception as exc:
+            return name, exc
 
     # Start with existing successful outputs (from previous run)
     research_outputs = [o for o in existing_outputs if o.get('success')]
     errors = []
     new_failed_agents = []
+    completed = 0
+    # Live counter — seeded with carried-over successes — so nothing
+    # needs to re-scan research_outputs afterwards
+    success_count = len(research_outputs)
 
-    for i, result in enumerate(results):
-        agent_name = agents_to_run[i]
+    for fut in asyncio.as_completed([_run(name) for name in agents_to_run]):
+        agent_name, result = await fut
+        completed += 1
 
         if isinstance(result, Exception):
             error_msg = str(result)
@@ -98,7 +110,7 @@ async def research_node(state: DueDiligenceState) -> Dict[str, Any]:
                 "error_type": type(result).__name__
             })
             new_failed_agents.append(agent_name)
-            logger.error(f"[{agent_name}] Exception: {type(result).__name__}: {error_msg}")
+            logger.error("[%s] Exception: %s: %s", agent_name, type(result).__name__, error_msg)
 
         elif not result.success:
             error_msg = result.error or "Unknown error"
@@ -114,9 +126,9 @@ async def research_node(state: DueDiligenceState) -> Dict[str, Any]:
                 "error_traceback": traceback_info
             })
             new_failed_agents.append(agent_name)
-            logger.error(f"[{agent_name}] Failed: {error_type or 'Error'}: {error_msg}")
+            logger.error("[%s] Failed: %s: %s", agent_name, error_type or 'Error', error_msg)
             if traceback_info:
-                logger.debug(f"[{agent_name}] Traceback:\n{traceback_info}")
+                logger.debug("[%s] Traceback:\n%s", agent_name, traceback_info)
 
         else:
             research_outputs.append({
@@ -126,23 +138,39 @@ async def research_node(state: DueDiligenceState) -> Dict[str, Any]:
                 "success": True,
                 "execution_time_ms": result.execution_time_ms
             })
-            print(f"  DONE: {agent_name} ({result.execution_time_ms/1000:.1f}s)")
+            success_count += 1
+            logger.info("  DONE: %s (%.1fs)", agent_name, result.execution_time_ms / 1000)
 
         # Debug: Show if we got partial output even on failure
-        if not result.success and hasattr(result, 'raw_output') and result.raw_output:
-            logger.info(f"[{agent_name}] Has partial output: {len(result.raw_output)} chars")
-            logger.debug(f"[{agent_name}] Partial output preview: {result.raw_output[:500]}")
+        partial = getattr(result, 'raw_output', None)
+        if not getattr(result, 'success', False) and partial:
+            logger.info("[%s] Has partial output: %d chars", agent_name, len(partial))
+            logger.debug("[%s] Partial output preview: %s", agent_name, partial[:500])
+
+        # Per-completion heartbeat so pollers see agents finishing live
+        publish_progress("research", {
+            "completed": completed,
+            "total": len(agents_to_run),
+            "last_agent": agent_name,
+        })
 
     elapsed = time.time() - start_time
-    success_count = sum(1 for r in research_outputs if r.get("success"))
-    total_count = len(all_agents)
+    total_count = len(ALL_RESEARCH_AGENTS)
 
-    print(f"\nResearch complete: {success_count}/{total_count} agents in {elapsed:.1f}s")
+    logger.info("Research complete: %d/%d agents in %.1fs", success_count, total_count, elapsed)
     if new_failed_agents:
-        print(f"  Failed agents: {', '.join(new_failed_agents)}")
+        logger.info("  Failed agents: %s", ', '.join(new_failed_agents))
+
+    publish_progress("research", {
+        "completed": success_count,
+        "total": total_count,
+        "failed": new_failed_agents,
+        "elapsed_s": round(elapsed, 1),
+    })
 
     return {
         "research_outputs": research_outputs,
+        "research_success_count": success_count,
         "errors": errors,
         "failed_research_agents": new_failed_agents,
         "current_stage": "research_complete"
@@ -150,21 +178,21 @@ async def research_node(state: DueDiligenceState) -> Dict[str, Any]:
 
 # conditional edge, after research is done we validate it? 
 async def validate_research_node(state: DueDiligenceState) -> Dict[str, Any]:
-    print("\nValidating research completeness...")
+    logger.info("Validating research completeness...")
     research_outputs = state.get('research_outputs', [])
     retry_count = state.get('retry_count',0)
-    success_count = sum(1 for research in research_outputs
-                        if research.get('success', False))
+    # research_node keeps this counter live; no need to re-scan outputs
+    success_count = state.get('research_success_count', 0)
     total_count = len(research_outputs)
     errors = []
 
     if total_count > 0 and success_count / total_count < 0.5:
         errors.append(f"CRITICAL: Only {success_count}/{total_count} research agents succeeded")
-        print(f"CRITICAL: Only {success_count}/{total_count} succeeded")
+        logger.info("CRITICAL: Only %d/%d succeeded", success_count, total_count)
         retry_count += 1
     
     else:
-        print(f"Validation passed: {success_count}/{total_count} succeeded")
+        logger.info("Validation passed: %d/%d succeeded", success_count, total_count)
 
     return {
         'current_stage': 'research_completed', 
@@ -172,12 +200,13 @@ async def validate_research_node(state: DueDiligenceState) -> Dict[str, Any]:
         'retry_count' : retry_count
     }
 
-def _get_agent_output(outputs: List[Dict], agent_name: str) -> Any:
-    """Extract a specific agent's output from the outputs list."""
-    for output in outputs:
-        if output.get("agent") == agent_name and output.get("success"):
-            return output.get("output")
-    return None
+def _index_outputs(outputs: List[Dict]) -> Dict[str, Any]:
+    """Index successful outputs by agent name.
+
+    Built once per node call so each extraction is a hash lookup instead
+    of its own scan over the outputs list.
+    """
+    return {o["agent"]: o.get("output") for o in outputs if o.get("success")}
 
 async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
     """
@@ -185,49 +214,78 @@ async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
 
     Some will run in parallel, but the risk assessor needs other outputs first.
     """
-    print("\n" + "=" * 60)
-    print("STAGE 3: ANALYSIS (4 agents)")
-    print("=" * 60)
+    logger.info("STAGE 3: ANALYSIS (4 agents)")
 
     startup_name = state["startup_name"]
     startup_description = state["startup_description"]
     research_outputs = state.get("research_outputs", [])
 
     # Extract specific research outputs for analysis
-    company_profile = _get_agent_output(research_outputs, "company_profiler")
-    market_analysis = _get_agent_output(research_outputs, "market_researcher")
-    team_analysis = _get_agent_output(research_outputs, "team_investigator")
+    research_index = _index_outputs(research_outputs)
+    company_profile = research_index.get("company_profiler")
+    market_analysis = research_index.get("market_researcher")
+    team_analysis = research_index.get("team_investigator")
 
-    print("  Starting: financial_analyst, tech_evaluator, legal_reviewer (parallel)")
+    logger.info("  Starting: financial_analyst, tech_evaluator, legal_reviewer (parallel)")
     start_time = time.time()
 
-    # Run first batch in parallel
-    first_batch = await asyncio.gather(
-        run_financial_analyst(
-            company_profile=company_profile,
-            market_analysis=market_analysis,
-            startup_name=startup_name,
-            startup_description=startup_description
-        ),
-        run_tech_evaluator(
-            startup_name=startup_name,
-            startup_description=startup_description,
-            team_analysis=team_analysis
-        ),
-        run_legal_reviewer(
-            startup_name=startup_name,
-            market_analysis=market_analysis
-        ),
-        return_exceptions=True
+    # Dependency DAG rather than a two-phase barrier: the first batch
+    # runs as independent tasks, and the risk assessor is launched
+    # immediately in a wrapper that awaits exactly the tasks it consumes.
+    # Today it reads all three analyses, so the critical path is the
+    # same, but narrowing its dependency set moves its start earlier
+    # without touching this orchestration.
+    tasks = start_all_analysis(
+        startup_name=startup_name,
+        startup_description=startup_description,
+        company_profile=company_profile,
+        market_analysis=market_analysis,
+        team_analysis=team_analysis,
     )
 
+    async def _risk_when_ready():
+        # Await the dependencies directly; failures just shrink the input
+        deps = []
+        for dep_name, dep_task in tasks.items():
+            try:
+                dep_result = await dep_task
+            except Exception:
+                continue  # the main loop records the failure
+            if dep_result.success:
+                deps.append({"agent": dep_name, "output": dep_result.output, "success": True})
+        logger.info("  Starting: risk_assessor (dependencies resolved)")
+        return await run_risk_assessor(
+            research_outputs=research_outputs,
+            analysis_outputs=deps,
+            startup_name=startup_name
+        )
+
+    risk_task = asyncio.create_task(_risk_when_ready())
+
     analysis_outputs = []
     errors = []
-
-    # Process first batch
-    first_batch_names = ["financial_analyst", "tech_evaluator", "legal_reviewer"]
-    for i, result in enumerate(first_batch):
-        agent_name = first_batch_names[i]
+    completed = 0
+
+    # Process the first batch in completion order, not submission order,
+    # so results are recorded (and progress published) as each agent
+    # lands instead of after the slowest one. as_completed yields fresh
+    # wrapper coroutines, never the original tasks, so each task is
+    # wrapped to carry its own name — same pattern as research_node.
+    async def _named(name: str, task):
+        try:
+            return name, await task
+        except Exception as exc:
+            return name, exc
+
+    for fut in asyncio.as_completed([_named(n, t) for n, t in tasks.items()]):
+        agent_name, result = await fut
+        completed += 1
+        # Per-completion heartbeat so pollers see agents finishing live
+        publish_progress("analysis", {
+            "completed": completed,
+            "total": 4,
+            "last_agent": agent_name,
+        })
         if isinstance(result, Exception):
             error_msg = str(result)
             errors.append(f"{agent_name}: {error_msg}")
@@ -236,7 +294,7 @@ async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
                 "success": False, "error": error_msg,
                 "error_type": type(result).__name__
             })
-            logger.error(f"[{agent_name}] Exception: {type(result).__name__}: {error_msg}")
+            logger.error("[%s] Exception: %s: %s", agent_name, type(result).__name__, error_msg)
         elif not result.success:
             error_msg = result.error or "Unknown error"
             error_type = getattr(result, 'error_type', None)
@@ -247,9 +305,9 @@ async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
                 "success": False, "error": error_msg,
                 "error_type": error_type
             })
-            logger.error(f"[{agent_name}] Failed: {error_type or 'Error'}: {error_msg}")
+            logger.error("[%s] Failed: %s: %s", agent_name, error_type or 'Error', error_msg)
             if traceback_info:
-                logger.debug(f"[{agent_name}] Traceback:\n{traceback_info}")
+                logger.debug("[%s] Traceback:\n%s", agent_name, traceback_info)
         else:
             analysis_outputs.append({
                 "agent": agent_name,
@@ -258,15 +316,13 @@ async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
                 "success": True,
                 "execution_time_ms": result.execution_time_ms
             })
-            print(f"  DONE: {agent_name} ({result.execution_time_ms/1000:.1f}s)")
+            logger.info("  DONE: %s (%.1fs)", agent_name, result.execution_time_ms / 1000)
 
-    # Now run risk assessor with ALL outputs
-    print("  Starting: risk_assessor (needs other analysis)")
-    risk_result = await run_risk_assessor(
-        research_outputs=research_outputs,
-        analysis_outputs=analysis_outputs,
-        startup_name=startup_name
-    )
+    # Risk assessor has been running since its dependencies resolved
+    try:
+        risk_result = await risk_task
+    except Exception as exc:
+        risk_result = exc
 
     if isinstance(risk_result, Exception) or not risk_result.success:
         if isinstance(risk_result, Exception):
@@ -281,7 +337,7 @@ async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
             "success": False, "error": error_msg,
             "error_type": error_type
         })
-        logger.error(f"[risk_assessor] Failed: {error_type or 'Error'}: {error_msg}")
+        logger.error("[risk_assessor] Failed: %s: %s", error_type or 'Error', error_msg)
     else:
         analysis_outputs.append({
             "agent": "risk_assessor",
@@ -290,11 +346,17 @@ async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
             "success": True,
             "execution_time_ms": risk_result.execution_time_ms
         })
-        print(f"  DONE: risk_assessor ({risk_result.execution_time_ms/1000:.1f}s)")
+        logger.info("  DONE: risk_assessor (%.1fs)", risk_result.execution_time_ms / 1000)
 
     elapsed = time.time() - start_time
     success_count = sum(1 for r in analysis_outputs if r.get("success"))
-    print(f"\nAnalysis complete: {success_count}/4 agents in {elapsed:.1f}s")
+    logger.info("Analysis complete: %d/4 agents in %.1fs", success_count, elapsed)
+
+    publish_progress("analysis", {
+        "completed": success_count,
+        "total": 4,
+        "elapsed_s": round(elapsed, 1),
+    })
     
     # update the state after node has completed... langgraph automatically consumes this.
     return {
@@ -305,12 +367,12 @@ async def analysis_node(state: DueDiligenceState) -> Dict[str, Any]:
 
 async def synthesis_node(state: DueDiligenceState) -> Dict[str, Any]:
     """
-    Run synthesis agents to generate final report and decision.
-    Report generator runs first, then decision agent uses the report.
+    Run the fused synthesis agent to generate final report and decision.
+
+    One Opus call emits both tagged sections instead of a Sonnet report
+    call followed by an Opus decision call re-uploading the same context.
     """
-    print("\n" + "=" * 60)
-    print("STAGE 4: SYNTHESIS (2 agents)")
-    print("=" * 60)
+    logger.info("STAGE 4: SYNTHESIS (fused report + decision)")
 
     startup_name = state["startup_name"]
     startup_description = state["startup_description"]
@@ -320,9 +382,8 @@ async def synthesis_node(state: DueDiligenceState) -> Dict[str, Any]:
 
     start_time = time.time()
 
-    # Run report generator first
-    print("  Starting: report_generator")
-    report_result = await run_report_generator(
+    logger.info("  Starting: synthesis")
+    synthesis_result = await run_synthesis(
         startup_name=startup_name,
         startup_description=startup_description,
         research_outputs=research_outputs,
@@ -330,48 +391,31 @@ async def synthesis_node(state: DueDiligenceState) -> Dict[str, Any]:
     )
 
     full_report = None
-    if isinstance(report_result, Exception) or not report_result.success:
-        if isinstance(report_result, Exception):
-            error_msg = str(report_result)
-            error_type = type(report_result).__name__
-        else:
-            error_msg = report_result.error or "Unknown error"
-            error_type = getattr(report_result, 'error_type', None)
-        errors.append(f"report_generator: {error_msg}")
-        logger.error(f"[report_generator] Failed: {error_type or 'Error'}: {error_msg}")
-    else:
-        full_report = report_result.output or report_result.raw_output
-        print(f"  DONE: report_generator ({report_result.execution_time_ms/1000:.1f}s)")
-
-    # Run decision agent with the report
-    print("  Starting: decision_agent")
-    risk_assessment = _get_agent_output(analysis_outputs, "risk_assessor")
-
-    decision_result = await run_decision_agent(
-        startup_name=startup_name,
-        full_report=full_report[:4000] if full_report else "",
-        risk_assessment=risk_assessment,
-        research_outputs=research_outputs,
-        analysis_outputs=analysis_outputs
-    )
-
     investment_decision = None
-    if isinstance(decision_result, Exception) or not decision_result.success:
-        if isinstance(decision_result, Exception):
-            error_msg = str(decision_result)
-            error_type = type(decision_result).__name__
-        else:
-            error_msg = decision_result.error or "Unknown error"
-            error_type = getattr(decision_result, 'error_type', None)
-        errors.append(f"decision_agent: {error_msg}")
-        logger.error(f"[decision_agent] Failed: {error_type or 'Error'}: {error_msg}")
+    if not synthesis_result.success:
+        error_msg = synthesis_result.error or "Unknown error"
+        error_type = getattr(synthesis_result, 'error_type', None)
+        errors.append(f"synthesis: {error_msg}")
+        logger.error("[synthesis] Failed: %s: %s", error_type or 'Error', error_msg)
     else:
-        investment_decision = decision_result.output
-        print(f"  DONE: decision_agent ({decision_result.execution_time_ms/1000:.1f}s)")
+        output = synthesis_result.output or {}
+        full_report = output.get("full_report")
+        investment_decision = output.get("investment_decision")
+        if not full_report:
+            errors.append("synthesis: response had no <REPORT> section")
+        if not investment_decision:
+            errors.append("synthesis: response had no parseable <DECISION> section")
+        logger.info("  DONE: synthesis (%.1fs)", synthesis_result.execution_time_ms / 1000)
 
     elapsed = time.time() - start_time
     success_count = (1 if full_report else 0) + (1 if investment_decision else 0)
-    print(f"\nSynthesis complete: {success_count}/2 agents in {elapsed:.1f}s")
+    logger.info("Synthesis complete: %d/2 outputs in %.1fs", success_count, elapsed)
+
+    publish_progress("synthesis", {
+        "outputs": success_count,
+        "total": 2,
+        "elapsed_s": round(elapsed, 1),
+    })
 
     return {
         "full_report": full_report,
@@ -381,9 +425,7 @@ async def synthesis_node(state: DueDiligenceState) -> Dict[str, Any]:
     }
 
 async def output_node(state: DueDiligenceState) -> Dict[str, Any]:
-    print("\n" + "=" * 60)
-    print("STAGE 5: OUTPUT")
-    print("=" * 60)
+    logger.info("STAGE 5: OUTPUT")
 
     errors = state.get("errors", [])
     full_report = state.get("full_report")
@@ -392,16 +434,16 @@ async def output_node(state: DueDiligenceState) -> Dict[str, Any]:
     # Determine final status
     if full_report and investment_decision:
         status = "complete"
-        print("Workflow completed successfully!")
+        logger.info("Workflow completed successfully!")
     elif full_report or investment_decision:
         status = "partial"
-        print("Workflow completed with partial results")
+        logger.info("Workflow completed with partial results")
     else:
         status = "failed"
-        print("Workflow failed")
+        logger.info("Workflow failed")
 
     if errors:
-        print(f"Total errors encountered: {len(errors)}")
+        logger.info("Total errors encountered: %d", len(errors))
 
     return {
         "current_stage": status
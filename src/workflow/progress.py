@@ -0,0 +1,31 @@
+"""Fire-and-forget job progress publishing.
+
+The workflow nodes know nothing about Redis or RQ; the worker entry point
+(run_agent_pipeline) installs a publisher callback, and nodes report
+stage boundaries through publish_progress. Publishing is best-effort by
+design — a slow or broken progress channel must never slow down or fail
+the analysis itself.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_publisher: Optional[Callable[[str, Dict[str, Any]], None]] = None
+
+
+def set_progress_publisher(publisher: Optional[Callable[[str, Dict[str, Any]], None]]) -> None:
+    """Install (or clear, with None) the process-wide progress publisher."""
+    global _publisher
+    _publisher = publisher
+
+
+def publish_progress(stage: str, detail: Dict[str, Any]) -> None:
+    """Report a stage boundary; a no-op when no publisher is installed."""
+    if _publisher is None:
+        return
+    try:
+        _publisher(stage, detail)
+    except Exception as exc:
+        logger.debug("Progress publish failed at stage %s: %s", stage, exc)
@@ -1,44 +1,43 @@
 from typing import Literal
 from ..state.schema import DueDiligenceState
 
-def check_init_success(state : DueDiligenceState) -> Literal['success', 'failure']:
-    errors = state.get('error', [])
+# Error strings that make initialization unrecoverable. Frozenset so new
+# critical tokens are an O(1) membership test, not another comparison.
+_CRITICAL_INIT_ERRORS = frozenset({'required'})
 
-    critical_errors = []
-    for e in errors:
-        if e.lower() == 'required':
-            critical_errors.append(e.lower())
-    
-    if critical_errors:
-        return 'failure'
 
+def check_init_success(state : DueDiligenceState) -> Literal['success', 'failed']:
+    # Reads 'errors' — an earlier version read 'error', a key that never
+    # exists in DueDiligenceState, so this could never route to 'failed'
+    errors = state.get('errors', [])
+    if any(e.lower() in _CRITICAL_INIT_ERRORS for e in errors):
+        return 'failed'
     return 'success'
 
+# Route keyed on (enough successes, retries left) — a lookup table
+# instead of an if-chain, so the policy reads off in one place:
+# below the bar with retries exhausted is a failure, not a silent pass.
+_RESEARCH_DECISIONS = {
+    (True, True): 'complete',
+    (True, False): 'complete',
+    (False, True): 'incomplete',
+    (False, False): 'failed',
+}
+
+
 def check_research_completeness(state : DueDiligenceState) -> Literal['complete', 'incomplete', 'failed']:
     research_outputs = state.get('research_outputs', [])
     retry_counts = state.get('retry_count', 0)
 
     if not research_outputs:
-        if retry_counts < 2: 
+        if retry_counts < 2:
             return 'incomplete'
         return 'failed'
-    
-    success_count = sum(1 for results in research_outputs
-                        if results.get('success',False))
-    
-    total_count = len(research_outputs)
 
-    if total_count == 0:
-        return 'failed'
-
-    success_rate = success_count / total_count
+    # research_node keeps this counter live; no need to re-scan outputs
+    success_count = state.get('research_success_count', 0)
+    total_count = len(research_outputs)
 
     # need 50% to pass:
-    if success_rate > 0.5:
-        return 'complete'
-    
-    if retry_counts < 2:
-        return 'incomplete'
-
-    # to many retries:
-    return 'complete'
+    success_rate = success_count / total_count
+    return _RESEARCH_DECISIONS[(success_rate > 0.5, retry_counts < 2)]